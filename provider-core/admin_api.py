@@ -1,26 +1,75 @@
 #!/usr/bin/env python3
+import concurrent.futures
+import copy
 import json
 import logging
 import os
 import hashlib
+import http.client
 import re
 import shutil
 import shlex
+import socket
 import subprocess
 import sys
+import tempfile
 import time
 import secrets
 import urllib.error
 import urllib.request
 import urllib.parse
+import xmlrpc.client
 import yaml
 import datetime
 import threading
 import uuid
-from contextlib import contextmanager
+import urllib3
+import orjson
+import websocket
+from contextlib import contextmanager, suppress
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from urllib3.util.retry import Retry
+try:
+    # libyaml-backed safe loader/dumper (python3-yaml ships them); pure Python otherwise
+    from yaml import CSafeDumper as YamlSafeDumper, CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper, SafeLoader as YamlSafeLoader
+try:
+    # supervisor's Python package ships with the image; talk to supervisord without forking supervisorctl
+    from supervisor.xmlrpc import Faults as SupervisorFaults, SupervisorTransport, UnixStreamHTTPConnection
+except ImportError:
+    SupervisorFaults = SupervisorTransport = UnixStreamHTTPConnection = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify()/get_json() through orjson; Flask's encoder still handles dates, Decimal, UUID."""
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _encode(self, obj, option: int = 0) -> bytes:
+        try:
+            return orjson.dumps(obj, default=self.default, option=self.option | option)
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits; the stdlib encoder copes
+            text = super().dumps(obj, sort_keys=False, separators=(",", ":"))
+            if option & orjson.OPT_APPEND_NEWLINE:
+                text += "\n"
+            return text.encode("utf-8")
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._encode(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj, orjson.OPT_APPEND_NEWLINE), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 # Configure logging to stdout at INFO so supervisor captures our app logs
 handler = logging.StreamHandler(sys.stdout)
 handler.setLevel(logging.INFO)
@@ -65,6 +114,46 @@ except ValueError:
 if PROVIDER_TOTALS_CACHE_TTL < 0:
     PROVIDER_TOTALS_CACHE_TTL = 0
 
+# Text-mode `all-services` line: "- <service> : <id> (<description>)"
+_SERVICE_LINE_RE = re.compile(r"^\s*-\s*(?P<service>[^:]+?)\s*:\s*(?P<id>[0-9]+)\s*\((?P<desc>.*)\)\s*$")
+# "account sequence mismatch, expected N, got M"
+_EXPECTED_SEQ_RE = re.compile(r"expected\s+(\d+)")
+# KEY=value lines of an env file; one layer of matching quotes around the value is dropped
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(?:'([^\n]*)'|"([^\n]*)"|([^\n]*?))[ \t\r]*$""", re.M
+)
+
+# Field aliases seen across arkeod CLI / LCD / older chain versions, in priority order
+_FIELDS: dict[str, tuple[str, ...]] = {
+    "id": ("id", "service_id", "serviceID"),
+    "name": ("service", "name", "label"),
+    "catalog_name": ("name", "service", "label"),
+    "description": ("description", "desc"),
+    "service_type": ("service_type", "type", "service_type_name", "serviceType"),
+    "pubkey": ("pub_key", "pubkey", "pubKey"),
+    "provider": ("provider", "provider_pubkey", "provider_pub_key"),
+    "provider_service_id": ("service_id", "id", "service"),
+    "provider_service_name": ("service", "name"),
+    "metadata_uri": ("metadata_uri", "metadataUri"),
+    "metadata_nonce": ("metadata_nonce", "metadataNonce"),
+    "min_dur": ("min_contract_duration", "min_contract_dur"),
+    "max_dur": ("max_contract_duration", "max_contract_dur"),
+    "sub_rate": ("subscription_rate", "subscription_rates"),
+    "paygo_rate": ("pay_as_you_go_rate", "pay_as_you_go_rates"),
+    "settle": ("settlement_duration", "settlement_dur"),
+}
+
+
+def _pick(d: dict, key: str):
+    """Return the first truthy alias of key in d (same semantics as an `a or b or c` chain)."""
+    get = d.get
+    val = None
+    for alias in _FIELDS[key]:
+        val = get(alias)
+        if val:
+            return val
+    return val
+
 ARKEOD_HOME = os.path.expanduser(os.getenv("ARKEOD_HOME", DEFAULT_ARKEOD_HOME))
 KEY_NAME = os.getenv("KEY_NAME", DEFAULT_KEY_NAME)
 KEYRING = os.getenv("KEY_KEYRING_BACKEND", DEFAULT_KEYRING)
@@ -159,6 +248,13 @@ CHAIN_ARGS = ["--chain-id", CHAIN_ID] if CHAIN_ID else []
 SUPERVISOR_CONF = os.getenv("SUPERVISOR_CONF", "/etc/supervisor/conf.d/supervisord.conf")
 SUPERVISORCTL = ["supervisorctl", "-c", SUPERVISOR_CONF]
 SUPERVISORCTL_FALLBACK = ["supervisorctl"]
+# Upper bound for supervisorctl calls so a wedged supervisord cannot pin an API worker thread
+SUPERVISORCTL_TIMEOUT_S = 30.0
+# supervisord XML-RPC socket ([unix_http_server] in supervisord.conf)
+SUPERVISOR_SERVERURL = os.getenv("SUPERVISOR_SERVERURL", "unix:///var/run/supervisor.sock")
+SENTINEL_LOG = "/var/log/provider-sentinel.log"
+SENTINEL_ERR_LOG = "/var/log/provider-sentinel.err.log"
+LOG_TAIL_LINES = 80
 SENTINEL_URI_DEFAULT = os.getenv("SENTINEL_URI") or _build_sentinel_uri()
 METADATA_NONCE_DEFAULT = os.getenv("METADATA_NONCE") or "1"
 BOND_DEFAULT = os.getenv("BOND_AMOUNT") or "1"
@@ -192,9 +288,19 @@ ADMIN_UI_ORIGIN = os.getenv("ADMIN_UI_ORIGIN") or f"http://localhost:{os.getenv(
 ADMIN_SESSIONS: dict[str, float] = {}
 CLAIMS_HEARTBEAT_PATH = os.path.join(CACHE_DIR, "claims-heartbeat.json") if CACHE_DIR else "claims-heartbeat.json"
 OSMOSIS_RPC = _strip_quotes(os.getenv("OSMOSIS_RPC") or "")
+# Optional Osmosis LCD; when unset, Osmosis queries go through osmosisd against OSMOSIS_RPC
+OSMOSIS_REST = _strip_quotes(os.getenv("OSMOSIS_REST") or "")
 OSMOSIS_HOME = os.path.expanduser(os.getenv("OSMOSIS_HOME", "/app/config/osmosis"))
 OSMOSIS_KEY_NAME = os.getenv("OSMOSIS_KEY_NAME", "osmo-provider")
 OSMOSIS_DENOM_CACHE = os.path.join(CACHE_DIR or "/app/cache", "osmo_denom_cache.json")
+OSMOSIS_DENOM_METADATA_CACHE = os.path.join(CACHE_DIR or "/app/cache", "osmo_denom_metadata_cache.json")
+# The bank denom-metadata table changes rarely; refetch it at most hourly
+DENOM_METADATA_TTL_S = 3600.0
+# IBC hashes the chain reported as unknown are not re-queried for this long
+DENOM_TRACE_MISS_TTL_S = 600.0
+# Base denoms that are ARKEO whatever the chain metadata says
+KNOWN_ARKEO_DENOMS = frozenset({"uarkeo", "arkeo"})
+_POW10 = tuple(10**i for i in range(19))
 DEFAULT_OSMOSIS_USDC_DENOMS = [
     # Axelar canonical USDC on Osmosis
     "ibc/27394FB092D2ECCD56123C74F36E4C1F926001CEADA9CA97EA622B25F41E5EB2",
@@ -223,7 +329,7 @@ DEFAULT_SLIPPAGE_BPS = int(os.getenv("DEFAULT_SLIPPAGE_BPS") or "100")
 ARRIVAL_TOLERANCE_BPS = int(os.getenv("ARRIVAL_TOLERANCE_BPS") or "100")
 OSMO_TO_ARKEO_CHANNEL = "channel-103074"
 ARKEO_TO_OSMO_CHANNEL = "channel-1"
-ENV_EXPORT_KEYS = [
+ENV_EXPORT_KEYS = (
     "PROVIDER_NAME",
     "MONIKER",
     "WEBSITE",
@@ -245,8 +351,11 @@ ENV_EXPORT_KEYS = [
     "ADMIN_PORT",
     "ADMIN_API_PORT",
     "OSMOSIS_RPC",
+    "OSMOSIS_REST",
     "WALLET_SYNC_INTERVAL",
-]
+)
+# (response key, env var) pairs, lowered once instead of per request
+_ENV_EXPORT_FIELDS = tuple((k.lower(), k) for k in ENV_EXPORT_KEYS)
 
 def _normalize_base(url: str | None, default_port: str | None = None, default_scheme: str = "http") -> str:
     """Return a normalized base URL with scheme/port if provided."""
@@ -320,18 +429,201 @@ PROVIDER_EXPORT_PATH = os.getenv("PROVIDER_EXPORT_PATH") or os.path.join(
     "provider-export.json",
 )
 
+# Shared worker pool for overlapping independent I/O-bound lookups within a request
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="admin-io")
+
+# Shared keep-alive pool for read-only RPC/LCD queries (avoids an arkeod fork per request).
+# num_pools is sized so the Arkeo LCD/RPC hosts are not evicted by Osmosis/sentinel traffic,
+# keeping sequence probes and their retries on an already-open connection.
+HTTP = urllib3.PoolManager(num_pools=8, maxsize=16, retries=Retry(total=2, backoff_factor=0.1))
+
+# Short-lived cache for read-only chain queries; results only change at block cadence (~6s)
+# key -> (value, expires_at)
+_QUERY_CACHE: dict[tuple, tuple[object, float]] = {}
+_QUERY_CACHE_LOCK = threading.Lock()
+_QUERY_CACHE_STATS = {"hits": 0, "misses": 0}
+QUERY_CACHE_MAX = 64
+QUERY_CACHE_TTL_S = 3.0
+ACCOUNT_CACHE_TTL_S = 1.0
+
+# Last /api/sentinel-status payload; dashboards poll it every 1-2s from several tabs
+# "gen" is bumped on invalidation so a refresh that started before it never stores its result
+_SENTINEL_STATUS_CACHE = {"ts": 0.0, "val": None, "gen": 0}
+_SENTINEL_STATUS_LOCK = threading.Lock()
+# held by the one request rebuilding the payload; others serve the stale copy meanwhile
+_SENTINEL_STATUS_REFRESH = threading.Lock()
+SENTINEL_STATUS_TTL_S = 1.0
+# past this age a stale payload is no longer served; callers wait for the refresh instead
+SENTINEL_STATUS_MAX_STALE_S = 5 * SENTINEL_STATUS_TTL_S
+
+
+def _cached_query(key: tuple, ttl: float, fetch, keep=None, nocache: bool = False):
+    """Return fetch() memoized under key for ttl seconds; keep(result) decides whether to store it."""
+    now = time.monotonic()
+    if not nocache:
+        with _QUERY_CACHE_LOCK:
+            hit = _QUERY_CACHE.get(key)
+            if hit and now < hit[1]:
+                _QUERY_CACHE_STATS["hits"] += 1
+                return hit[0]
+            _QUERY_CACHE_STATS["misses"] += 1
+    result = fetch()
+    if keep is not None and not keep(result):
+        return result
+    with _QUERY_CACHE_LOCK:
+        if len(_QUERY_CACHE) >= QUERY_CACHE_MAX and key not in _QUERY_CACHE:
+            for stale in [k for k, (_v, exp) in _QUERY_CACHE.items() if exp <= now]:
+                del _QUERY_CACHE[stale]
+            if len(_QUERY_CACHE) >= QUERY_CACHE_MAX:
+                del _QUERY_CACHE[min(_QUERY_CACHE, key=lambda k: _QUERY_CACHE[k][1])]
+        _QUERY_CACHE[key] = (result, time.monotonic() + ttl)
+    return result
+
+
+def _flush_query_cache() -> int:
+    """Drop all cached chain queries; returns the number of entries removed."""
+    with _QUERY_CACHE_LOCK:
+        count = len(_QUERY_CACHE)
+        _QUERY_CACHE.clear()
+    return count
+
+
+def _arkeo_rpc_base() -> str:
+    """Return the Tendermint RPC base URL for ARKEOD_NODE (tcp:// becomes http://)."""
+    return _ensure_http_rpc(ARKEOD_NODE).rstrip("/")
+
+
+def _arkeo_rest_base() -> str:
+    """Return the Cosmos LCD base URL (PROVIDER_HUB_URI)."""
+    return _normalize_base(os.getenv("PROVIDER_HUB_URI"))
+
+
+def _http_get(url: str, fields: dict | None = None, timeout: float = 6.0) -> tuple[int, bytes, str | None]:
+    """GET url through the shared pool and return (status, body, error)."""
+    try:
+        resp = HTTP.request("GET", url, fields=fields, timeout=timeout)
+    except Exception as e:
+        return 0, b"", str(e)
+    return resp.status, resp.data or b"", None
+
 
-def run(cmd: str) -> tuple[int, str]:
-    """Run a shell command and return (exit_code, output)."""
+def _http_get_json(url: str, fields: dict | None = None, timeout: float = 6.0) -> tuple[dict | list | None, str | None]:
+    """GET url and decode a JSON body; returns (data, error)."""
+    status, body, err = _http_get(url, fields=fields, timeout=timeout)
+    if err:
+        return None, err
+    if status != 200:
+        return None, f"HTTP {status} from {url}: {body[:300].decode('utf-8', errors='replace')}"
     try:
-        out = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT)
-        return 0, out.decode("utf-8")
-    except subprocess.CalledProcessError as e:
-        return e.returncode, e.output.decode("utf-8")
+        return orjson.loads(body), None
+    except orjson.JSONDecodeError:
+        return None, f"invalid JSON from {url}"
 
 
-def run_list(cmd: list[str], timeout: float | None = None) -> tuple[int, str]:
-    """Run a command without a shell and return (exit_code, output)."""
+def _fetch_rest_paginated(
+    path: str, extract, per_page_limit: int | None, total_cap: int = 0, rest: str | None = None
+) -> tuple[dict | None, str | None]:
+    """Walk an LCD list endpoint via pagination.key; returns ({items, pagination, pages}, error).
+
+    rest defaults to the Arkeo LCD (PROVIDER_HUB_URI).
+    """
+    rest = rest or _arkeo_rest_base()
+    if not rest:
+        return None, "PROVIDER_HUB_URI not configured"
+    url = f"{rest}{path}"
+    items: list = []
+    seen_keys = set()
+    next_key = None
+    pages = 0
+    last_pagination: dict = {}
+    while True:
+        fields = {}
+        if per_page_limit:
+            fields["pagination.limit"] = str(per_page_limit)
+        if next_key:
+            fields["pagination.key"] = next_key
+        data, err = _http_get_json(url, fields=fields or None)
+        if err:
+            return None, err
+        page_items = extract(data)
+        items.extend(page_items)
+        pages += 1
+        last_pagination = _extract_pagination(data)
+        if total_cap and len(items) >= total_cap:
+            break
+        next_key = last_pagination.get("next_key") or last_pagination.get("nextKey")
+        if not next_key or not page_items:
+            break
+        next_key = str(next_key)
+        if next_key in seen_keys:
+            break
+        seen_keys.add(next_key)
+    return {"items": items, "pagination": last_pagination, "pages": pages, "source": url}, None
+
+
+def _extract_account_sequence(data) -> int | None:
+    """Pull the account sequence from an auth account response (LCD or arkeod JSON)."""
+    if not isinstance(data, dict):
+        return None
+    account = data.get("account") or data.get("result") or {}
+    if not isinstance(account, dict):
+        return None
+    for candidate in (account, account.get("value"), account.get("base_account")):
+        if isinstance(candidate, dict) and candidate.get("sequence") is not None:
+            try:
+                return int(candidate.get("sequence"))
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def _fetch_account_sequence(address: str, nocache: bool = False) -> int | None:
+    """Return the current account sequence, cached for ACCOUNT_CACHE_TTL_S."""
+    if not address:
+        return None
+    return _cached_query(
+        ("auth-account", ARKEOD_NODE, _arkeo_rest_base(), address),
+        ACCOUNT_CACHE_TTL_S,
+        lambda: _fetch_account_sequence_uncached(address),
+        keep=lambda seq: seq is not None,
+        nocache=nocache,
+    )
+
+
+def _fetch_account_sequence_uncached(address: str) -> int | None:
+    """Return the current account sequence (LCD first, arkeod CLI fallback)."""
+    rest = _arkeo_rest_base()
+    if rest:
+        data, err = _http_get_json(f"{rest}/cosmos/auth/v1beta1/accounts/{urllib.parse.quote(address)}")
+        if not err:
+            seq = _extract_account_sequence(data)
+            if seq is not None:
+                return seq
+    acct_cmd = ["arkeod", "--home", ARKEOD_HOME, "query", "auth", "account", address, "-o", "json", *NODE_ARGS]
+    code, raw = run_list_bytes(acct_cmd)
+    if code != 0:
+        return None
+    try:
+        return _extract_account_sequence(orjson.loads(raw))
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _query_bank_balances(address: str) -> tuple[dict | None, str | None]:
+    """Return the bank balances payload for an Arkeo address from the LCD."""
+    rest = _arkeo_rest_base()
+    if not rest:
+        return None, "PROVIDER_HUB_URI not configured"
+    data, err = _http_get_json(f"{rest}/cosmos/bank/v1beta1/balances/{urllib.parse.quote(address)}")
+    if err:
+        return None, err
+    if not isinstance(data, dict):
+        return None, "unexpected balances response"
+    return data, None
+
+
+def run_list_bytes(cmd: list[str], timeout: float | None = None) -> tuple[int, bytes]:
+    """Run a command without a shell and return (exit_code, raw output bytes)."""
     try:
         proc = subprocess.run(
             cmd,
@@ -340,14 +632,18 @@ def run_list(cmd: list[str], timeout: float | None = None) -> tuple[int, str]:
             check=False,
             timeout=timeout,
         )
-        out = proc.stdout.decode("utf-8", errors="replace") if proc.stdout else ""
-        return proc.returncode, out
+        return proc.returncode, proc.stdout or b""
     except subprocess.TimeoutExpired as e:
-        out = e.output.decode("utf-8", errors="replace") if e.output else ""
-        msg = f"timeout after {timeout}s"
-        return 124, f"{out}\n{msg}".strip()
+        msg = f"timeout after {timeout}s".encode()
+        return 124, b"\n".join(part for part in (e.output or b"", msg) if part).strip()
     except Exception as e:
-        return 1, str(e)
+        return 1, str(e).encode("utf-8", errors="replace")
+
+
+def run_list(cmd: list[str], timeout: float | None = None) -> tuple[int, str]:
+    """Run a command without a shell and return (exit_code, output)."""
+    code, raw = run_list_bytes(cmd, timeout=timeout)
+    return code, raw.decode("utf-8", errors="replace")
 
 
 def run_with_input(cmd: list[str], input_text: str, timeout: float | None = None) -> tuple[int, str]:
@@ -573,8 +869,9 @@ def _fetch_contracts_paginated() -> dict:
             page=page if page_mode == "page" else None,
             limit=per_page_limit or None,
         )
-        code, out = run_list(cmd)
+        code, raw = run_list_bytes(cmd)
         if code != 0:
+            out = raw.decode("utf-8", errors="replace")
             if page_mode == "page-key" and "unknown flag" in out and "page-key" in out:
                 page_mode = "page"
                 if not forced_mode:
@@ -594,8 +891,8 @@ def _fetch_contracts_paginated() -> dict:
                 "error": out,
             }
         try:
-            data = json.loads(out)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             return {
                 "fetched_at": _timestamp(),
                 "exit_code": 1,
@@ -638,6 +935,16 @@ def _fetch_contracts_paginated() -> dict:
 
 
 def _fetch_provider_services_paginated() -> dict:
+    """Fetch all providers, served from the query cache within QUERY_CACHE_TTL_S."""
+    return _cached_query(
+        ("list-providers", ARKEOD_NODE, _arkeo_rest_base()),
+        QUERY_CACHE_TTL_S,
+        _fetch_provider_services_paginated_uncached,
+        keep=lambda payload: payload.get("exit_code") == 0,
+    )
+
+
+def _fetch_provider_services_paginated_uncached() -> dict:
     """Fetch all providers across pages, honoring pagination next_key when present."""
     global _PROVIDERS_PAGE_MODE
     forced_mode = _env_page_mode("PROVIDER_SERVICES_PAGE_MODE")
@@ -652,14 +959,26 @@ def _fetch_provider_services_paginated() -> dict:
     per_page_limit = _page_limit("PROVIDER_SERVICES_PAGE_SIZE")
     last_pagination = {}
 
+    rest_result, _rest_err = _fetch_rest_paginated("/arkeo/providers", _extract_providers_list, per_page_limit, total_cap)
+    if rest_result is not None and rest_result["items"]:
+        return {
+            "fetched_at": _timestamp(),
+            "exit_code": 0,
+            "cmd": _providers_list_cmd(limit=per_page_limit or None),
+            "source": rest_result["source"],
+            "data": {"providers": rest_result["items"], "pagination": rest_result["pagination"]},
+            "pages": rest_result["pages"],
+        }
+
     while True:
         cmd = _providers_list_cmd(
             page_key=page_key if page_mode == "page-key" else None,
             page=page if page_mode == "page" else None,
             limit=per_page_limit or None,
         )
-        code, out = run_list(cmd)
+        code, raw = run_list_bytes(cmd)
         if code != 0:
+            out = raw.decode("utf-8", errors="replace")
             if page_mode == "page-key" and "unknown flag" in out and "page-key" in out:
                 page_mode = "page"
                 if not forced_mode:
@@ -679,8 +998,8 @@ def _fetch_provider_services_paginated() -> dict:
                 "error": out,
             }
         try:
-            data = json.loads(out)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             return {
                 "fetched_at": _timestamp(),
                 "exit_code": 1,
@@ -723,6 +1042,16 @@ def _fetch_provider_services_paginated() -> dict:
 
 
 def _fetch_service_types_paginated() -> dict:
+    """Fetch service types, served from the query cache within QUERY_CACHE_TTL_S."""
+    return _cached_query(
+        ("all-services", ARKEOD_NODE, _arkeo_rest_base()),
+        QUERY_CACHE_TTL_S,
+        _fetch_service_types_paginated_uncached,
+        keep=lambda payload: payload.get("exit_code") == 0,
+    )
+
+
+def _fetch_service_types_paginated_uncached() -> dict:
     """Fetch service types across pages, honoring pagination next_key when present."""
     global _SERVICE_TYPES_PAGE_MODE
     forced_mode = _env_page_mode("SERVICE_TYPES_PAGE_MODE")
@@ -737,14 +1066,26 @@ def _fetch_service_types_paginated() -> dict:
     per_page_limit = _page_limit("SERVICE_TYPES_PAGE_SIZE")
     last_pagination = {}
 
+    rest_result, _rest_err = _fetch_rest_paginated("/arkeo/services", _extract_service_types_list, per_page_limit, total_cap)
+    if rest_result is not None and rest_result["items"]:
+        return {
+            "fetched_at": _timestamp(),
+            "exit_code": 0,
+            "cmd": _service_types_cmd(limit=per_page_limit or None),
+            "source": rest_result["source"],
+            "data": {"services": rest_result["items"], "pagination": rest_result["pagination"]},
+            "pages": rest_result["pages"],
+        }
+
     while True:
         cmd = _service_types_cmd(
             page_key=page_key if page_mode == "page-key" else None,
             page=page if page_mode == "page" else None,
             limit=per_page_limit or None,
         )
-        code, out = run_list(cmd)
+        code, raw = run_list_bytes(cmd)
         if code != 0:
+            out = raw.decode("utf-8", errors="replace")
             if page_mode == "page-key" and "unknown flag" in out and "page-key" in out:
                 page_mode = "page"
                 if not forced_mode:
@@ -764,8 +1105,9 @@ def _fetch_service_types_paginated() -> dict:
                 "error": out,
             }
         try:
-            data = json.loads(out)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            out = raw.decode("utf-8", errors="replace")
             data = _parse_json_loose(out)
             if data is None:
                 parsed = _parse_service_types_text(out)
@@ -1412,6 +1754,15 @@ def _wait_for_osmo_balance_increase(
 
 def _arkeo_balance(addr: str) -> tuple[int, str | None]:
     """Return (amount_base_units, error) for Arkeo wallet."""
+    data, rest_err = _query_bank_balances(addr)
+    if data is not None:
+        for b in data.get("balances") or []:
+            if b.get("denom") == "uarkeo":
+                try:
+                    return int(b.get("amount", "0")), None
+                except Exception:
+                    return 0, None
+        return 0, None
     try:
         cmd = [
             "arkeod",
@@ -1444,8 +1795,30 @@ def _arkeo_balance(addr: str) -> tuple[int, str | None]:
 
 
 # ---------- Osmosis helpers ----------
-def _osmosis_balances_raw(addr: str) -> list[dict]:
-    """Return raw balances list for an Osmosis address."""
+def _osmosis_rest_base() -> str:
+    """Return the Osmosis LCD base URL (OSMOSIS_REST), or "" to use osmosisd."""
+    # Keep any path prefix (e.g. https://rest.cosmos.directory/osmosis); only the scheme is checked
+    base = (OSMOSIS_REST or "").strip().rstrip("/")
+    if not base:
+        return ""
+    if "://" not in base:
+        return f"http://{base}"
+    if base.split("://", 1)[0].lower() not in ("http", "https"):
+        return ""
+    return base
+
+
+def _osmosis_balances_raw(addr: str, public_fallback: bool = True) -> list[dict]:
+    """Return raw balances list for an Osmosis address (LCD first, osmosisd fallback).
+
+    public_fallback=False skips the rest.cosmos.directory retry when osmosisd fails.
+    """
+    rest = _osmosis_rest_base()
+    if rest:
+        data, _err = _http_get_json(f"{rest}/cosmos/bank/v1beta1/balances/{urllib.parse.quote(addr)}")
+        if isinstance(data, dict) and isinstance(data.get("balances"), list):
+            return data["balances"]
+
     def _via_osmosisd() -> list[dict]:
         cmd = [
             "osmosisd",
@@ -1458,23 +1831,24 @@ def _osmosis_balances_raw(addr: str) -> list[dict]:
             "--output",
             "json",
         ]
-        code, out = run_list(cmd)
+        code, out = run_list_bytes(cmd)
         if code != 0:
-            raise RuntimeError(f"osmosis balances exit={code}: {out}")
-        data = json.loads(out)
+            raise RuntimeError(f"osmosis balances exit={code}: {out.decode('utf-8', errors='replace')}")
+        data = orjson.loads(out)
         return data.get("balances") or data.get("result") or []
 
     def _via_rest_fallback() -> list[dict]:
         url = f"https://rest.cosmos.directory/osmosis/cosmos/bank/v1beta1/balances/{addr}"
-        code, out = run_list(["curl", "-s", url])
-        if code != 0:
-            raise RuntimeError(f"osmosis balances rest exit={code}: {out}")
-        data = json.loads(out)
+        data, err = _http_get_json(url)
+        if err:
+            raise RuntimeError(f"osmosis balances rest: {err}")
         return data.get("balances") or data.get("result") or []
 
     try:
         return _via_osmosisd()
     except Exception as e:
+        if not public_fallback:
+            raise
         try:
             return _via_rest_fallback()
         except Exception:
@@ -1495,39 +1869,77 @@ def _load_osmo_cache() -> dict:
 def _save_osmo_cache(cache: dict) -> None:
     try:
         os.makedirs(os.path.dirname(OSMOSIS_DENOM_CACHE) or ".", exist_ok=True)
-        with open(OSMOSIS_DENOM_CACHE, "w") as f:
-            json.dump(cache, f, indent=2, sort_keys=True)
+        _write_bytes_atomic(OSMOSIS_DENOM_CACHE, orjson.dumps(cache))
     except Exception:
         pass
 
 
+# ibc hash -> monotonic time it was reported not found
+_DENOM_TRACE_MISSES: dict[str, float] = {}
+_DENOM_TRACE_MISSES_LOCK = threading.Lock()
+
+
+def _denom_trace_miss(ibc_hash: str) -> None:
+    with _DENOM_TRACE_MISSES_LOCK:
+        _DENOM_TRACE_MISSES[ibc_hash] = time.monotonic()
+
+
+def _query_denom_trace(ibc_hash: str) -> dict | None:
+    """Return the denom trace for an IBC hash, or None when the lookup fails (LCD first)."""
+    with _DENOM_TRACE_MISSES_LOCK:
+        missed_at = _DENOM_TRACE_MISSES.get(ibc_hash)
+    if missed_at is not None and time.monotonic() - missed_at < DENOM_TRACE_MISS_TTL_S:
+        return None
+    rest = _osmosis_rest_base()
+    if rest:
+        # transient HTTP errors are already retried by the pool's Retry policy
+        status, body, _err = _http_get(f"{rest}/ibc/apps/transfer/v1/denom_traces/{urllib.parse.quote(ibc_hash)}")
+        if status == 200:
+            try:
+                data = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                data = None
+            if isinstance(data, dict) and isinstance(data.get("denom_trace"), dict):
+                return data["denom_trace"]
+        elif status == 404:
+            _denom_trace_miss(ibc_hash)
+            return None
+    cmd = [
+        "osmosisd",
+        "query",
+        "ibc-transfer",
+        "denom-trace",
+        ibc_hash,
+        "--node",
+        OSMOSIS_RPC,
+        "--output",
+        "json",
+    ]
+    # One retry for timeouts/RPC hiccups; a definite "not found" is negative-cached instead
+    for _attempt in range(2):
+        code, out = run_list_bytes(cmd)
+        if code == 0:
+            try:
+                return orjson.loads(out).get("denom_trace") or {}
+            except Exception:
+                return None
+        if b"not found" in out.lower():
+            _denom_trace_miss(ibc_hash)
+            return None
+    return None
+
+
 def _query_denom_trace_cached(ibc_hash: str, cache: dict) -> tuple[dict, dict, bool]:
     """Return (trace, cache, cache_updated)."""
     if not ibc_hash:
         return {}, cache, False
     if ibc_hash in cache:
         return cache.get(ibc_hash) or {}, cache, False
-    try:
-        cmd = [
-            "osmosisd",
-            "query",
-            "ibc-transfer",
-            "denom-trace",
-            ibc_hash,
-            "--node",
-            OSMOSIS_RPC,
-            "--output",
-            "json",
-        ]
-        code, out = run_list(cmd)
-        if code != 0:
-            return {}, cache, False
-        data = json.loads(out)
-        trace = data.get("denom_trace") or {}
-        cache[ibc_hash] = trace
-        return trace, cache, True
-    except Exception:
+    trace = _query_denom_trace(ibc_hash)
+    if trace is None:
         return {}, cache, False
+    cache[ibc_hash] = trace
+    return trace, cache, True
 
 
 def _resolve_base_denom(denom: str, cache: dict) -> tuple[str, dict, bool]:
@@ -1543,6 +1955,16 @@ def _resolve_base_denom(denom: str, cache: dict) -> tuple[str, dict, bool]:
 
 
 def _query_all_denom_metadata() -> list[dict]:
+    rest = _osmosis_rest_base()
+    if rest:
+        result, _err = _fetch_rest_paginated(
+            "/cosmos/bank/v1beta1/denoms_metadata",
+            lambda data: (data.get("metadatas") or []) if isinstance(data, dict) else [],
+            _page_limit("DENOM_METADATA_PAGE_SIZE"),
+            rest=rest,
+        )
+        if result is not None and result["items"]:
+            return result["items"]
     try:
         cmd = [
             "osmosisd",
@@ -1554,37 +1976,88 @@ def _query_all_denom_metadata() -> list[dict]:
             "--output",
             "json",
         ]
-        code, out = run_list(cmd)
+        # The full metadata table can run to megabytes; parse the raw bytes without decoding first
+        code, out = run_list_bytes(cmd)
         if code != 0:
             return []
-        data = json.loads(out)
+        data = orjson.loads(out)
         return data.get("metadatas") or []
     except Exception:
         return []
 
 
+# (fetched_at, node, base_denom -> (symbol, decimals)) for the metadata currently on disk
+_METADATA_INDEX: tuple[float, str, dict] | None = None
+# (sha256 of the metadatas payload, index) so an unchanged hourly refresh skips the rebuild
+_METADATA_INDEX_BY_DIGEST: tuple[bytes, dict] | None = None
+
+
+def _load_denom_metadata_index(refresh: bool = False) -> dict:
+    """Return the denom metadata index, served from the on-disk cache within DENOM_METADATA_TTL_S."""
+    global _METADATA_INDEX
+    now = time.time()
+    # Key on the endpoint the metadata actually comes from (LCD, else osmosisd's RPC)
+    source = _osmosis_rest_base() or OSMOSIS_RPC
+    memo = _METADATA_INDEX
+    if not refresh and memo is not None and memo[1] == source and now - memo[0] < DENOM_METADATA_TTL_S:
+        return memo[2]
+    if not refresh:
+        try:
+            with open(OSMOSIS_DENOM_METADATA_CACHE, "r") as f:
+                cached = json.load(f)
+            fetched_at = float(cached.get("fetched_at") or 0)
+            if cached.get("node") == source and now - fetched_at < DENOM_METADATA_TTL_S:
+                idx = _build_metadata_index(cached.get("metadatas") or [])
+                _METADATA_INDEX = (fetched_at, source, idx)
+                return idx
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+    metadatas = _query_all_denom_metadata()
+    idx = _build_metadata_index(metadatas)
+    if metadatas:
+        try:
+            os.makedirs(os.path.dirname(OSMOSIS_DENOM_METADATA_CACHE) or ".", exist_ok=True)
+            _write_bytes_atomic(
+                OSMOSIS_DENOM_METADATA_CACHE,
+                orjson.dumps({"metadatas": metadatas, "fetched_at": now, "node": source}),
+            )
+        except OSError:
+            pass
+        _METADATA_INDEX = (now, source, idx)
+    return idx
+
+
 def _build_metadata_index(metadatas: list[dict]) -> dict:
-    """base_denom -> (symbol, decimals)"""
+    """base_denom -> (symbol, decimals); reuses the previous index when the metadata is unchanged."""
+    global _METADATA_INDEX_BY_DIGEST
+    digest = hashlib.sha256(orjson.dumps(metadatas)).digest()
+    memo = _METADATA_INDEX_BY_DIGEST
+    if memo is not None and memo[0] == digest:
+        return memo[1]
     idx: dict[str, tuple[str, int]] = {}
     for md in metadatas:
         base = md.get("base")
         display = md.get("display")
-        denom_units = md.get("denom_units") or []
+        if not base or not display:
+            continue
+        # exponent of the display unit, else the largest exponent seen
         decimals = None
-        for du in denom_units:
-            if du.get("denom") == display:
-                try:
-                    decimals = int(du.get("exponent", 0))
-                except Exception:
-                    decimals = 0
-                break
-        if decimals is None and denom_units:
+        max_exp = None
+        for du in md.get("denom_units") or ():
             try:
-                decimals = max(int(du.get("exponent", 0)) for du in denom_units)
+                exp = int(du.get("exponent", 0))
             except Exception:
-                decimals = None
-        if base and display and decimals is not None:
-            idx[base] = (str(display).upper(), int(decimals))
+                exp = None
+            if du.get("denom") == display:
+                decimals = exp or 0
+                break
+            if exp is not None and (max_exp is None or exp > max_exp):
+                max_exp = exp
+        if decimals is None:
+            decimals = max_exp
+        if decimals is not None:
+            idx[base] = (str(display).upper(), decimals)
+    _METADATA_INDEX_BY_DIGEST = (digest, idx)
     return idx
 
 
@@ -1595,7 +2068,7 @@ def _heuristic_symbol_and_decimals(base_denom: str | None, denom: str) -> tuple[
             return "OSMO", 6
         if b in ("uusdc", "usdc"):
             return "USDC", 6
-        if b in ("uarkeo", "arkeo"):
+        if b in KNOWN_ARKEO_DENOMS:
             return "ARKEO", 8
         if b.startswith("u") and len(b) > 1:
             return b[1:].upper(), 6
@@ -1609,64 +2082,58 @@ def _resolve_osmo_assets(addr: str) -> tuple[list[dict] | None, str | None]:
     """Resolve Osmosis assets with denom-traces/metadata."""
     if not OSMOSIS_RPC:
         return None, "OSMOSIS_RPC not configured"
+    # The metadata index does not depend on the balances; load it while they are queried
+    md_future = _IO_POOL.submit(_load_denom_metadata_index)
     cache = _load_osmo_cache()
     cache_updated = False
     try:
-        bal_cmd = [
-            "osmosisd",
-            "query",
-            "bank",
-            "balances",
-            addr,
-            "--node",
-            OSMOSIS_RPC,
-            "--output",
-            "json",
-        ]
-        code, out = run_list(bal_cmd)
-        if code != 0:
-            return None, f"osmosis balance exit={code}: {out}"
-        data = json.loads(out)
-        balances = data.get("balances") or data.get("result") or []
+        # Only the operator's OSMOSIS_REST is tried before osmosisd; never a third-party LCD
+        balances = _osmosis_balances_raw(addr, public_fallback=False)
     except Exception as e:
         return None, str(e)
 
-    md_idx = _build_metadata_index(_query_all_denom_metadata())
-    assets: list[dict] = []
-
+    # Split out the IBC hash once; both the trace fan-out and the row pass below use it
+    rows = []
     for b in balances:
         denom = b.get("denom", "")
-        amt = b.get("amount", "0")
+        rows.append((denom, b.get("amount", "0"), denom[4:] if denom.startswith("ibc/") else None))
+
+    # Fan out the uncached denom-trace lookups instead of resolving them one by one
+    missing = list({h for _denom, _amt, h in rows if h and h not in cache})
+    if missing:
+        for ibc_hash, trace in zip(missing, _IO_POOL.map(_query_denom_trace, missing)):
+            if trace is not None:
+                cache[ibc_hash] = trace
+                cache_updated = True
+
+    md_idx = md_future.result()
+    md_get = md_idx.get
+    cache_get = cache.get
+    assets: list[dict] = []
+
+    for denom, amt, ibc_hash in rows:
         try:
             amount_int = int(amt)
         except Exception:
             amount_int = 0
-        is_ibc = denom.startswith("ibc/")
+        is_ibc = ibc_hash is not None
         base_denom = None
         path = None
         if is_ibc:
-            ibc_hash = denom.split("/", 1)[1] if "/" in denom else ""
-            trace, cache, updated = _query_denom_trace_cached(ibc_hash, cache)
-            cache_updated = cache_updated or updated
+            # every trace was fetched above; one that failed there resolves like an unknown denom
+            trace = cache_get(ibc_hash) or {}
             base_denom = trace.get("base_denom")
             path = trace.get("path")
 
-        symbol = None
-        decimals = None
-        if base_denom and base_denom in md_idx:
-            symbol, decimals = md_idx.get(base_denom) or (None, None)
-        elif denom in md_idx:
-            symbol, decimals = md_idx.get(denom) or (None, None)
+        if (base_denom or denom).lower() in KNOWN_ARKEO_DENOMS:
+            symbol, decimals = "ARKEO", 8
         else:
-            symbol, decimals = _heuristic_symbol_and_decimals(base_denom, denom)
-
-        if (base_denom or "").lower() in ("uarkeo", "arkeo") or denom.lower() == "uarkeo":
-            symbol = "ARKEO"
-            decimals = 8
+            hit = (md_get(base_denom) if base_denom else None) or md_get(denom)
+            symbol, decimals = hit or _heuristic_symbol_and_decimals(base_denom, denom)
 
         display_amount = None
         if decimals is not None:
-            display_amount = amount_int / (10 ** decimals)
+            display_amount = amount_int / (_POW10[decimals] if 0 <= decimals < len(_POW10) else 10**decimals)
         label = symbol
         if is_ibc and symbol:
             label = f"{symbol} (IBC)"
@@ -1744,21 +2211,26 @@ def _pool_2977_state() -> tuple[dict | None, str | None]:
     cache = _load_osmo_cache()
     cache_updated = False
     try:
-        cmd = [
-            "osmosisd",
-            "query",
-            "gamm",
-            "pool",
-            "2977",
-            "--node",
-            OSMOSIS_RPC,
-            "--output",
-            "json",
-        ]
-        code, out = run_list(cmd)
-        if code != 0:
-            return None, f"pool query exit={code}: {out}"
-        data = json.loads(out)
+        rest = _osmosis_rest_base()
+        data = None
+        if rest:
+            data, _err = _http_get_json(f"{rest}/osmosis/gamm/v1beta1/pools/2977")
+        if not isinstance(data, dict) or not data.get("pool"):
+            cmd = [
+                "osmosisd",
+                "query",
+                "gamm",
+                "pool",
+                "2977",
+                "--node",
+                OSMOSIS_RPC,
+                "--output",
+                "json",
+            ]
+            code, out = run_list_bytes(cmd)
+            if code != 0:
+                return None, f"pool query exit={code}: {out.decode('utf-8', errors='replace')}"
+            data = orjson.loads(out)
         pool = data.get("pool") or {}
         assets = pool.get("pool_assets") or pool.get("assets") or []
         swap_fee_str = pool.get("pool_params", {}).get("swap_fee") or pool.get("swap_fee") or "0"
@@ -2113,8 +2585,8 @@ def _auth_exempt(path: str) -> bool:
 def _require_auth():
     """Require session auth when admin password is set."""
     if request.method == "OPTIONS":
-        resp = app.make_response(("", 204, _cors_headers()))
-        return resp
+        # Bare preflight reply; add_cors attaches the CORS headers
+        return app.response_class(status=204)
     if _auth_exempt(request.path):
         return
     if not _is_auth_required():
@@ -2180,14 +2652,93 @@ def read_cache_json(name: str):
 
 @app.after_request
 def add_cors(resp):
-    headers = _cors_headers()
-    for k, v in headers.items():
-        resp.headers[k] = v
+    resp.headers.extend(_cors_headers())
     return resp
 
 
+# (home, user, keyring_backend) -> (raw_pubkey, bech32_pubkey, error, expires_at or None)
+_PUBKEY_CACHE: dict[tuple[str, str, str], tuple[str, str, str | None, float | None]] = {}
+_PUBKEY_CACHE_LOCK = threading.Lock()
+PUBKEY_ERROR_TTL_S = 5.0
+
+
+# (home, user, keyring_backend) -> account address; keyring reads only change on wallet ops
+_ADDRESS_CACHE: dict[tuple[str, str, str], str] = {}
+# (input stamp, serialized /api/provider-info body); rebuilt when any input changes
+_PROVIDER_INFO_BODY: tuple[tuple, bytes] | None = None
+# Bumped by every flush; a lookup that started before a flush must not store its result
+_PUBKEY_CACHE_GEN = 0
+
+
+def _flush_pubkey_cache() -> int:
+    """Drop all cached pubkeys and addresses; returns the number of entries removed."""
+    global _PROVIDER_INFO_BODY, _PUBKEY_CACHE_GEN
+    with _PUBKEY_CACHE_LOCK:
+        count = len(_PUBKEY_CACHE) + len(_ADDRESS_CACHE)
+        _PUBKEY_CACHE.clear()
+        _ADDRESS_CACHE.clear()
+        _PROVIDER_INFO_BODY = None
+        _PUBKEY_CACHE_GEN += 1
+    return count
+
+
+def _file_stamp(path: str | None) -> tuple[int, int, int, int] | None:
+    """Return (inode, mtime_ns, ctime_ns, size) for path, or None when it does not exist."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    # inode catches atomic replaces that keep size and land in the same mtime tick
+    return st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size
+
+
+def _tail(path: str, n: int = 80, blocksize: int = 8192) -> str:
+    """Return the last n lines of path, reading backwards from the end in blocks."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(blocksize, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    lines = buf.splitlines()[-n:]
+    return (b"\n".join(lines) + b"\n" if lines else b"").decode("utf-8", "replace")
+
+
 def derive_pubkeys(user: str, keyring_backend: str) -> tuple[str, str, str | None]:
-    """Return (raw_pubkey, bech32_pubkey, error)."""
+    """Return (raw_pubkey, bech32_pubkey, error), cached per key for the life of the process."""
+    key = (ARKEOD_HOME, user, keyring_backend)
+    with _PUBKEY_CACHE_LOCK:
+        hit = _PUBKEY_CACHE.get(key)
+        gen = _PUBKEY_CACHE_GEN
+    if hit:
+        raw_pubkey, bech32_pubkey, err, expires_at = hit
+        if expires_at is None or time.monotonic() < expires_at:
+            return raw_pubkey, bech32_pubkey, err
+    raw_pubkey, bech32_pubkey, err = _derive_pubkeys_uncached(user, keyring_backend)
+    # Successful lookups never expire; failures are retried after a short back-off
+    expires_at = None if err is None else time.monotonic() + PUBKEY_ERROR_TTL_S
+    with _PUBKEY_CACHE_LOCK:
+        if gen == _PUBKEY_CACHE_GEN:
+            _PUBKEY_CACHE[key] = (raw_pubkey, bech32_pubkey, err, expires_at)
+    return raw_pubkey, bech32_pubkey, err
+
+
+def _bech32_acc_from_output(out: bytes) -> str:
+    """Return the "Bech32 Acc:" value from `arkeod debug pubkey-raw` output, or ""."""
+    _, sep, tail = out.partition(b"Bech32 Acc:")
+    if not sep:
+        return ""
+    end = tail.find(b"\n")
+    return tail[: end if end >= 0 else None].strip().decode("utf-8", errors="replace")
+
+
+def _derive_pubkeys_uncached(user: str, keyring_backend: str) -> tuple[str, str, str | None]:
+    """Return (raw_pubkey, bech32_pubkey, error) by asking arkeod."""
     pubkey_cmd = [
         "arkeod",
         "--home",
@@ -2211,32 +2762,35 @@ def derive_pubkeys(user: str, keyring_backend: str) -> tuple[str, str, str | Non
         return "", "", f"could not parse raw pubkey: {pubkey_out}"
 
     bech32_cmd = ["arkeod", "debug", "pubkey-raw", raw_pubkey]
-    code, bech32_out = run_list(bech32_cmd)
+    code, bech32_out = run_list_bytes(bech32_cmd)
     if code != 0:
-        return raw_pubkey, "", f"failed to convert pubkey: {bech32_out}"
+        return raw_pubkey, "", f"failed to convert pubkey: {bech32_out.decode('utf-8', errors='replace')}"
 
-    bech32_pubkey = ""
-    for line in bech32_out.splitlines():
-        if line.startswith("Bech32 Acc:"):
-            bech32_pubkey = line.replace("Bech32 Acc:", "").strip()
-            break
+    bech32_pubkey = _bech32_acc_from_output(bech32_out)
     if not bech32_pubkey:
-        return raw_pubkey, "", f"Bech32 pubkey not found: {bech32_out}"
+        return raw_pubkey, "", f"Bech32 pubkey not found: {bech32_out.decode('utf-8', errors='replace')}"
 
     return raw_pubkey, bech32_pubkey, None
 
 
 def derive_address(user: str, keyring_backend: str) -> tuple[str, str | None]:
-    """Return (address, error) for the given key."""
-    cmd = (
-        f"arkeod --home {ARKEOD_HOME} "
-        f"--keyring-backend {keyring_backend} "
-        f"keys show {user} -a"
-    )
-    code, out = run(cmd)
+    """Return (address, error) for the given key; successful lookups are cached like pubkeys."""
+    key = (ARKEOD_HOME, user, keyring_backend)
+    with _PUBKEY_CACHE_LOCK:
+        address = _ADDRESS_CACHE.get(key)
+        gen = _PUBKEY_CACHE_GEN
+    if address:
+        return address, None
+    cmd = ["arkeod", "--home", ARKEOD_HOME, "--keyring-backend", keyring_backend, "keys", "show", user, "-a"]
+    code, out = run_list(cmd)
     if code != 0:
         return "", out
-    return out.strip(), None
+    address = out.strip()
+    if address:
+        with _PUBKEY_CACHE_LOCK:
+            if gen == _PUBKEY_CACHE_GEN:
+                _ADDRESS_CACHE[key] = address
+    return address, None
 
 
 def provider_pubkeys_response(user: str, keyring_backend: str):
@@ -2252,13 +2806,67 @@ def provider_pubkeys_response(user: str, keyring_backend: str):
     return resp
 
 
+def _provider_exists(bech32_pubkey: str, service: str) -> bool:
+    """Return True when the provider is already bonded for service (LCD first, CLI fallback)."""
+    lookup_status = 0
+    rest = _arkeo_rest_base()
+    if rest:
+        lookup_url = f"{rest}/arkeo/provider/{urllib.parse.quote(bech32_pubkey)}/{urllib.parse.quote(str(service))}"
+        lookup_status, _body, _err = _http_get(lookup_url)
+    if lookup_status == 200:
+        return True
+    if lookup_status == 404:
+        return False
+    lookup_cmd = [
+        "arkeod",
+        "--home",
+        ARKEOD_HOME,
+        "query",
+        "arkeo",
+        "provider",
+        bech32_pubkey,
+        service,
+        "-o",
+        "json",
+    ]
+    if ARKEOD_NODE:
+        lookup_cmd.extend(["--node", ARKEOD_NODE])
+    code, _out = run_list(lookup_cmd)
+    return code == 0
+
+
+@app.post("/api/_cache/flush")
+def cache_flush():
+    """Drop in-process caches (pubkeys, chain queries) so the next request refetches them."""
+    return jsonify({"status": "flushed", "pubkeys": _flush_pubkey_cache(), "queries": _flush_query_cache()})
+
+
+@app.get("/api/_cache/stats")
+def cache_stats():
+    """Report in-process cache sizes and query-cache hit/miss counters."""
+    with _PUBKEY_CACHE_LOCK:
+        pubkeys = len(_PUBKEY_CACHE)
+    with _QUERY_CACHE_LOCK:
+        queries = {"entries": len(_QUERY_CACHE), **_QUERY_CACHE_STATS}
+    return jsonify({"pubkeys": pubkeys, "queries": queries, "ttl_s": QUERY_CACHE_TTL_S})
+
+
+_PING_BODY = b'{"status":"ok"}\n'
+# arkeod can only change with the image, so the first successful answer is served for the
+# life of the worker (a gunicorn HUP restarts workers and re-derives it)
+_VERSION_BODY: bytes | None = None
+
+
 @app.get("/api/ping")
 def ping():
-    return jsonify({"status": "ok"})
+    return app.response_class(_PING_BODY, mimetype="application/json")
 
 @app.get("/api/version")
 def version():
-    code, out = run("arkeod version")
+    global _VERSION_BODY
+    if _VERSION_BODY is not None:
+        return app.response_class(_VERSION_BODY, mimetype="application/json")
+    code, out = run_list(["arkeod", "version"])
     response = {"app_version": APP_VERSION}
     if code != 0:
         detail = out.strip()
@@ -2269,26 +2877,103 @@ def version():
         return jsonify(response)
     ver = out.strip() or "unknown"
     response["arkeod_version"] = ver
-    return jsonify(response)
+    resp = jsonify(response)
+    _VERSION_BODY = resp.get_data()
+    return resp
+
+# (height, monotonic time seen, ws url) pushed by the NewBlockHeader subscription
+_LATEST_HEIGHT: tuple[int, float, str] | None = None
+# Serve the pushed height only while it is fresh (a few blocks); otherwise query the node
+BLOCK_HEIGHT_MAX_AGE_S = 30.0
+
+
+def _arkeo_ws_url() -> str:
+    """Return the Tendermint websocket URL for ARKEOD_NODE."""
+    rpc = _arkeo_rpc_base()
+    if rpc.startswith("https://"):
+        return f"wss://{rpc[len('https://'):]}/websocket"
+    if rpc.startswith("http://"):
+        return f"ws://{rpc[len('http://'):]}/websocket"
+    return ""
+
+
+def _block_height_watcher() -> None:
+    """Follow NewBlockHeader events over the node websocket and record the latest height."""
+    global _LATEST_HEIGHT
+    backoff = 1.0
+    while True:
+        # Re-read the URL on every connect so node changes from settings are picked up
+        url = _arkeo_ws_url()
+        if not url:
+            time.sleep(30)
+            continue
+        try:
+            ws = websocket.create_connection(url, timeout=30)
+            try:
+                ws.send(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "subscribe",
+                            "id": 1,
+                            "params": {"query": "tm.event='NewBlockHeader'"},
+                        }
+                    )
+                )
+                while url == _arkeo_ws_url():
+                    msg = orjson.loads(ws.recv())
+                    value = ((msg.get("result") or {}).get("data") or {}).get("value") or {}
+                    header = value.get("header") or (value.get("block") or {}).get("header") or {}
+                    if header.get("height") is not None:
+                        _LATEST_HEIGHT = (int(header["height"]), time.monotonic(), url)
+                        backoff = 1.0
+            finally:
+                ws.close()
+        except Exception as e:
+            app.logger.debug("block-height ws %s: %s", url, e)
+        time.sleep(backoff)
+        backoff = min(backoff * 2, 60.0)
+
+
+threading.Thread(target=_block_height_watcher, name="block-height-ws", daemon=True).start()
+
 
 @app.get("/api/block-height")
 def block_height():
     """Return the latest block height from the configured node."""
+    latest = _LATEST_HEIGHT
+    if latest is not None and time.monotonic() - latest[1] < BLOCK_HEIGHT_MAX_AGE_S and latest[2] == _arkeo_ws_url():
+        return jsonify({"height": str(latest[0])})
+    rpc = _arkeo_rpc_base()
+    if rpc:
+        data, _err = _http_get_json(f"{rpc}/status")
+        if isinstance(data, dict):
+            status = data.get("result") or data
+            sync_info = status.get("sync_info") or status.get("SyncInfo") or {}
+            height = sync_info.get("latest_block_height") or sync_info.get("latest_block")
+            if height is not None:
+                return jsonify({"height": str(height), "status": status})
     cmd = ["arkeod", "--home", ARKEOD_HOME]
     if ARKEOD_NODE:
         cmd.extend(["--node", ARKEOD_NODE])
     cmd.append("status")
-    code, out = run_list(cmd)
+    code, raw = run_list_bytes(cmd)
     if code != 0:
-        return jsonify({"error": "failed to fetch status", "detail": out, "cmd": cmd}), 500
+        return jsonify({"error": "failed to fetch status", "detail": raw.decode("utf-8", errors="replace"), "cmd": cmd}), 500
     try:
-        data = json.loads(out)
-        # handle common casing
-        sync_info = data.get("SyncInfo") or data.get("sync_info") or {}
-        height = sync_info.get("latest_block_height") or sync_info.get("latest_block")
-        return jsonify({"height": str(height) if height is not None else None, "status": data})
-    except json.JSONDecodeError:
-        return jsonify({"error": "invalid JSON from status", "detail": out, "cmd": cmd}), 500
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return jsonify({"error": "invalid JSON from status", "detail": raw.decode("utf-8", errors="replace"), "cmd": cmd}), 500
+    # handle common casing
+    sync_info = (data.get("SyncInfo") or data.get("sync_info") or {}) if isinstance(data, dict) else {}
+    height = sync_info.get("latest_block_height") or sync_info.get("latest_block")
+    height = str(height) if height is not None else None
+    if height is not None and height.isdigit():
+        # Pass the already-validated status object through verbatim instead of re-encoding it
+        return app.response_class(
+            b'{"height":"%s","status":%s}\n' % (height.encode(), raw.strip()), mimetype="application/json"
+        )
+    return jsonify({"height": height, "status": data})
 
 
 @app.get("/api/osmosis-block-height")
@@ -2669,7 +3354,7 @@ def hotwallet_arkeo_to_osmosis():
             if (ibc_code != 0 or not ibc_tx) and "account sequence mismatch" in str(ibc_out).lower():
                 for attempt in range(4):
                     exp = None
-                    m_exp = re.search(r"expected\s+(\d+)", str(ibc_out))
+                    m_exp = _EXPECTED_SEQ_RE.search(str(ibc_out))
                     if m_exp:
                         exp = m_exp.group(1)
                     if exp:
@@ -2692,28 +3377,9 @@ def hotwallet_arkeo_to_osmosis():
                         if target is not None:
                             deadline = time.time() + 12
                             while time.time() < deadline:
-                                try:
-                                    seq_cmd = ["arkeod", "--home", ARKEOD_HOME, "query", "auth", "account", arkeo_addr, "-o", "json"]
-                                    if ARKEOD_NODE:
-                                        seq_cmd.extend(["--node", ARKEOD_NODE])
-                                    seq_code, seq_out = run_list(seq_cmd)
-                                    if seq_code == 0:
-                                        acct = json.loads(seq_out)
-                                        if isinstance(acct, dict):
-                                            account_info = acct.get("account") or acct.get("result") or {}
-                                            seq_val = None
-                                            if isinstance(account_info, dict):
-                                                val = account_info.get("value") or account_info
-                                                if isinstance(val, dict):
-                                                    seq_val = val.get("sequence")
-                                                elif account_info.get("base_account"):
-                                                    base = account_info.get("base_account") or {}
-                                                    if isinstance(base, dict):
-                                                        seq_val = base.get("sequence")
-                                            if seq_val is not None and int(seq_val) >= target:
-                                                break
-                                except Exception:
-                                    pass
+                                seq_val = _fetch_account_sequence(arkeo_addr, nocache=True)
+                                if seq_val is not None and seq_val >= target:
+                                    break
                                 time.sleep(1.0)
                     # Retry the original cmd (let CLI pick the sequence after chain advances)
                     ibc_code, ibc_out = run_list(ibc_cmd)
@@ -2843,40 +3509,27 @@ def hotwallet_arkeo_to_osmosis():
 
 @app.get("/api/key")
 def get_key():
-    cmd = (
-        f"arkeod --home {ARKEOD_HOME} "
-        f"--keyring-backend {KEYRING} "
-        f"keys show {KEY_NAME} -a"
-    )
-    code, out = run(cmd)
-    if code != 0:
-        return jsonify({"address": None, "error": "failed to get key address", "detail": out}), 200
+    address, err = derive_address(KEY_NAME, KEYRING)
+    if err is not None:
+        return jsonify({"address": None, "error": "failed to get key address", "detail": err}), 200
 
-    address = out.strip()
     return jsonify({"address": address})
 
 
 @app.get("/api/balance")
 def get_balance():
     # first get address
-    addr_cmd = (
-        f"arkeod --home {ARKEOD_HOME} "
-        f"--keyring-backend {KEYRING} "
-        f"keys show {KEY_NAME} -a"
-    )
-    code, addr_out = run(addr_cmd)
-    if code != 0:
-        return jsonify({"address": None, "error": "failed to get key address", "detail": addr_out}), 200
+    address, addr_err = derive_address(KEY_NAME, KEYRING)
+    if addr_err is not None:
+        return jsonify({"address": None, "error": "failed to get key address", "detail": addr_err}), 200
 
-    address = addr_out.strip()
+    # then query balances from the LCD, falling back to the CLI
+    data, _rest_err = _query_bank_balances(address)
+    if data is not None:
+        return jsonify({"address": address, "balance": data})
 
-    # then query balances in JSON form
-    bal_cmd = (
-        f"arkeod query bank balances {address} "
-        f"{'--node ' + ARKEOD_NODE if ARKEOD_NODE else ''} "
-        f"-o json"
-    )
-    code, bal_out = run(bal_cmd)
+    bal_cmd = ["arkeod", "query", "bank", "balances", address, *NODE_ARGS, "-o", "json"]
+    code, bal_out = run_list(bal_cmd)
 
     if code != 0:
         return jsonify(
@@ -3034,33 +3687,36 @@ def bond_and_mod_provider():
         sentinel_uri,
     )
 
+    # Key lookups and the service-id resolution are independent; overlap them
+    address_future = _IO_POOL.submit(derive_address, user, keyring_backend)
+    pubkeys_future = _IO_POOL.submit(derive_pubkeys, user, keyring_backend)
+
+    def _lookup_service_name_by_id(sid: str) -> str | None:
+        payload = _fetch_service_types_paginated()
+        if payload.get("exit_code") != 0:
+            return None
+        data = payload.get("data")
+        services = _extract_service_types_list(data)
+        for item in services if isinstance(services, list) else []:
+            if not isinstance(item, dict):
+                continue
+            sid_val = str(_pick(item, "id") or "")
+            if sid_val == sid:
+                return item.get("service") or item.get("name") or sid
+        return None
+
     # Resolve numeric service IDs to the service name (CLI expects name)
     resolved_service = service
     lookup_note = ""
     if isinstance(service, str) and service.strip().isdigit():
         svc_id = service.strip()
-
-        def _lookup_service_name_by_id(sid: str) -> str | None:
-            payload = _fetch_service_types_paginated()
-            if payload.get("exit_code") != 0:
-                return None
-            data = payload.get("data")
-            services = _extract_service_types_list(data)
-            for item in services if isinstance(services, list) else []:
-                if not isinstance(item, dict):
-                    continue
-                sid_val = str(item.get("id") or item.get("service_id") or item.get("serviceID") or "")
-                if sid_val == sid:
-                    return item.get("service") or item.get("name") or sid
-            return None
-
         looked_up = _lookup_service_name_by_id(svc_id)
         if looked_up:
             resolved_service = looked_up
         else:
             lookup_note = f"could not resolve service id {svc_id} to name"
 
-    raw_pubkey, bech32_pubkey, pubkey_err = derive_pubkeys(user, keyring_backend)
+    raw_pubkey, bech32_pubkey, pubkey_err = pubkeys_future.result()
     if pubkey_err:
         _emit_provider_service_failed("pubkey", service, resolved_service, pubkey_err)
         return jsonify(
@@ -3073,30 +3729,29 @@ def bond_and_mod_provider():
             }
         ), 500
 
-    def fetch_sequence(bech32: str, min_expected: int | None = None, attempts: int = 5, delay: float = 1.0) -> list[str]:
-        """Fetch account sequence with retries; optionally wait until it reaches min_expected."""
+    # Account queries need the account address (not the pubkey)
+    account_address, _addr_err = address_future.result()
+
+    def fetch_sequence(
+        min_expected: int | None = None,
+        attempts: int = 5,
+        delay: float = 1.0,
+        max_delay: float | None = None,
+        nocache: bool = False,
+    ) -> list[str]:
+        """Fetch account sequence with retries; optionally wait until it reaches min_expected.
+
+        With max_delay set the delay doubles after each miss (capped at max_delay).
+        """
         seq_val = None
         for _ in range(attempts):
-            try:
-                acct_cmd = ["arkeod", "--home", ARKEOD_HOME, "query", "auth", "account", bech32, "-o", "json"]
-                if ARKEOD_NODE:
-                    acct_cmd.extend(["--node", ARKEOD_NODE])
-                code, acct_out = run_list(acct_cmd)
-                if code == 0:
-                    acct = json.loads(acct_out)
-                    if isinstance(acct, dict):
-                        account_info = acct.get("account") or acct.get("result") or {}
-                        if isinstance(account_info, dict):
-                            val = account_info.get("value") or account_info
-                            if isinstance(val, dict):
-                                seq_val = val.get("sequence")
-                    if seq_val is not None:
-                        seq_int = int(seq_val)
-                        if min_expected is None or seq_int >= min_expected:
-                            return ["--sequence", str(seq_int)]
-            except Exception:
-                pass
+            # When waiting for the sequence to advance a cached value is by definition stale
+            seq_val = _fetch_account_sequence(account_address, nocache=nocache or min_expected is not None)
+            if seq_val is not None and (min_expected is None or seq_val >= min_expected):
+                return ["--sequence", str(seq_val)]
             time.sleep(delay)
+            if max_delay is not None:
+                delay = min(delay * 2, max_delay)
         return ["--sequence", str(seq_val)] if seq_val is not None else []
 
     # If provider already exists, skip rebond and go straight to mod.
@@ -3104,7 +3759,10 @@ def bond_and_mod_provider():
     bond_cmd: list[str] | None = None
     bond_code = 0
     bond_out = "skipped: provider already bonded"
-    initial_seq_arg: list[str] = fetch_sequence(bech32_pubkey, attempts=2, delay=0.5)
+    # The sequence probe and the existence lookup are independent; run them side by side
+    seq_future = _IO_POOL.submit(fetch_sequence, attempts=2, delay=0.5)
+    exists_future = _IO_POOL.submit(_provider_exists, bech32_pubkey, resolved_service)
+    initial_seq_arg: list[str] = seq_future.result()
     initial_seq_val = None
     try:
         if initial_seq_arg:
@@ -3112,28 +3770,11 @@ def bond_and_mod_provider():
     except Exception:
         initial_seq_val = None
     try:
-        lookup_cmd = [
-            "arkeod",
-            "--home",
-            ARKEOD_HOME,
-            "query",
-            "arkeo",
-            "provider",
-            bech32_pubkey,
-            resolved_service,
-            "-o",
-            "json",
-        ]
-        if ARKEOD_NODE:
-            lookup_cmd.extend(["--node", ARKEOD_NODE])
-        code, lookup_out = run_list(lookup_cmd)
-        if code == 0:
-            skip_bond = True
-            bond_out = "skipped: provider already exists"
-        else:
-            skip_bond = False
+        skip_bond = exists_future.result()
     except Exception:
         skip_bond = False
+    if skip_bond:
+        bond_out = "skipped: provider already exists"
 
     if not skip_bond:
         bond_cmd = [
@@ -3158,7 +3799,8 @@ def bond_and_mod_provider():
         ]
         bond_code, bond_out = run_list(bond_cmd)
         bond_txhash = _log_tx_result(f"bond-mod-provider bond service={resolved_service}", bond_code, bond_out)
-        _log_tx_height_async("bond-mod-provider bond", bond_txhash)
+        if initial_seq_val is not None:
+            _log_tx_height_async("bond-mod-provider bond", bond_txhash)
         if bond_code != 0:
             _emit_provider_service_failed(
                 "bond",
@@ -3187,52 +3829,58 @@ def bond_and_mod_provider():
                 }
             ), 500
 
-        # Give the bond a moment to settle before mod-provider
-        time.sleep(6)
-
-    # Fetch account sequence to avoid mismatch (with retries to catch fresh state)
-    min_expected_seq = None
+    # Fetch account sequence to avoid mismatch. After a bond, poll with backoff until the
+    # sequence advances past the pre-bond value instead of sleeping a fixed settle time;
+    # 14 attempts (0.1s doubling to 1s) keeps the previous ~11s worst case.
     if not skip_bond and initial_seq_val is not None:
-        min_expected_seq = initial_seq_val + 1
-    sequence_arg: list[str] = fetch_sequence(bech32_pubkey, min_expected=min_expected_seq, attempts=5, delay=1.0)
+        sequence_arg: list[str] = fetch_sequence(
+            min_expected=initial_seq_val + 1, attempts=14, delay=0.1, max_delay=1.0
+        )
+    elif not skip_bond:
+        # No pre-bond sequence to compare against: wait for the bond tx to be included so the
+        # fresh read below already reflects it
+        bond_height = _poll_tx_height(bond_txhash, attempts=12, delay=1.0) if bond_txhash else None
+        app.logger.info(
+            "bond-mod-provider bond height=%s txhash=%s", bond_height or "pending", bond_txhash
+        )
+        sequence_arg = fetch_sequence(attempts=5, delay=1.0, nocache=True)
+    else:
+        sequence_arg = fetch_sequence(attempts=5, delay=1.0)
 
-    mod_cmd_base = [
-        "arkeod",
-        "--home",
-        ARKEOD_HOME,
-        "tx",
-        "arkeo",
-        "mod-provider",
-        bech32_pubkey,
-        resolved_service,
-        sentinel_uri,
-        metadata_nonce,
-        status,
-        min_contract_dur,
-        max_contract_dur,
-        subscription_rates,
-        pay_as_you_go_rates,
-        settlement_dur,
-        *NODE_ARGS,
-        *CHAIN_ARGS,
-        "--from",
-        user,
-        "--fees",
-        fees,
-        "--keyring-backend",
-        keyring_backend,
-        "-y",
-    ]
+    def _build_mod_cmd(seq_arg: list[str]) -> list[str]:
+        return [
+            "arkeod",
+            "--home",
+            ARKEOD_HOME,
+            "tx",
+            "arkeo",
+            "mod-provider",
+            bech32_pubkey,
+            resolved_service,
+            sentinel_uri,
+            metadata_nonce,
+            status,
+            min_contract_dur,
+            max_contract_dur,
+            subscription_rates,
+            pay_as_you_go_rates,
+            settlement_dur,
+            *NODE_ARGS,
+            *CHAIN_ARGS,
+            *seq_arg,
+            "--from",
+            user,
+            "--fees",
+            fees,
+            "--keyring-backend",
+            keyring_backend,
+            "-y",
+        ]
 
     def run_mod_with_sequence(seq_arg: list[str]):
-        cmd = mod_cmd_base.copy()
-        # insert sequence args just before the --from flag
-        try:
-            insert_at = cmd.index("--from")
-        except ValueError:
-            insert_at = len(cmd)
-        cmd[insert_at:insert_at] = seq_arg
-        return cmd, *run_list(cmd)
+        cmd = _build_mod_cmd(seq_arg)
+        code, out = run_list(cmd)
+        return cmd, code, out
 
     app.logger.info("bond-mod-provider mod sequence arg=%s", sequence_arg)
     mod_cmd, mod_code, mod_out = run_mod_with_sequence(sequence_arg)
@@ -3242,35 +3890,20 @@ def bond_and_mod_provider():
 
     # Retry once on account-sequence mismatch by refetching or using the expected sequence
     if "account sequence mismatch" in str(mod_out):
-        time.sleep(1)
         retry_seq: list[str] = []
-        # First, try to parse the expected sequence from the error text
-        m = re.search(r"expected\s+(\d+)", str(mod_out))
+        # First, try to parse the expected sequence from the error text; the node told us
+        # exactly what it wants, so retry immediately
+        m = _EXPECTED_SEQ_RE.search(str(mod_out))
         if m:
             retry_seq = ["--sequence", m.group(1)]
         # If not found, re-query the account for the latest sequence
         if not retry_seq:
             for _ in range(2):
-                try:
-                    acct_cmd = ["arkeod", "--home", ARKEOD_HOME, "query", "auth", "account", bech32_pubkey, "-o", "json"]
-                    if ARKEOD_NODE:
-                        acct_cmd.extend(["--node", ARKEOD_NODE])
-                    code, acct_out = run_list(acct_cmd)
-                    if code == 0:
-                        acct = json.loads(acct_out)
-                        seq_val = None
-                        if isinstance(acct, dict):
-                            account_info = acct.get("account") or acct.get("result") or {}
-                            if isinstance(account_info, dict):
-                                val = account_info.get("value") or account_info
-                                if isinstance(val, dict):
-                                    seq_val = val.get("sequence")
-                        if seq_val is not None:
-                            retry_seq = ["--sequence", str(seq_val)]
-                            break
-                except Exception:
-                    pass
                 time.sleep(1)
+                seq_val = _fetch_account_sequence(account_address, nocache=True)
+                if seq_val is not None:
+                    retry_seq = ["--sequence", str(seq_val)]
+                    break
         mod_cmd, mod_code, mod_out = run_mod_with_sequence(retry_seq)
         app.logger.info("bond-mod-provider retry mod with sequence=%s code=%s", retry_seq, mod_code)
         mod_txhash = _log_tx_result(f"bond-mod-provider mod-retry service={resolved_service}", mod_code, mod_out)
@@ -3381,6 +4014,26 @@ def bond_and_mod_provider():
 @app.get("/api/provider-info")
 def provider_info():
     """Return hotwallet provider info including pubkeys and defaults."""
+    global _PROVIDER_INFO_BODY
+    # Everything the body depends on: settings/env/export files plus the live key/node globals
+    stamp = (
+        _file_stamp(PROVIDER_SETTINGS_PATH),
+        _file_stamp(os.path.join(CACHE_DIR or "/app/cache", "provider-settings.json")),
+        _file_stamp(PROVIDER_EXPORT_PATH),
+        _file_stamp(SENTINEL_ENV_PATH),
+        KEY_NAME,
+        KEYRING,
+        ARKEOD_HOME,
+        ARKEOD_NODE,
+        os.getenv("SENTINEL_PORT"),
+        os.getenv("SENTINEL_NODE"),
+    )
+    with _PUBKEY_CACHE_LOCK:
+        cached = _PROVIDER_INFO_BODY
+        gen = _PUBKEY_CACHE_GEN
+    if cached is not None and cached[0] == stamp:
+        return app.response_class(cached[1], mimetype="application/json")
+
     user = KEY_NAME
     keyring_backend = KEYRING
     fees = FEES_DEFAULT
@@ -3395,8 +4048,9 @@ def provider_info():
     export_bundle = _load_export_bundle()
     provider_metadata = (export_bundle and export_bundle.get("env_file")) or _load_env_file(SENTINEL_ENV_PATH)
 
+    address_future = _IO_POOL.submit(derive_address, user, keyring_backend)
     base = provider_pubkeys_response(user, keyring_backend)
-    address, addr_err = derive_address(user, keyring_backend)
+    address, addr_err = address_future.result()
     # Ensure provider metadata reflects the current hotwallet pubkey and sentinel URI
     try:
         if isinstance(provider_metadata, dict):
@@ -3420,7 +4074,13 @@ def provider_info():
     )
     if addr_err:
         base["address_error"] = addr_err
-    return jsonify(base)
+    resp = jsonify(base)
+    if not addr_err and "pubkey_error" not in base:
+        body = resp.get_data()
+        with _PUBKEY_CACHE_LOCK:
+            if gen == _PUBKEY_CACHE_GEN:
+                _PROVIDER_INFO_BODY = (stamp, body)
+    return resp
 
 
 @app.get("/api/wallets")
@@ -3446,18 +4106,23 @@ def list_services():
     if rest_base:
         try:
             url = f"{rest_base}/arkeo/services"
-            with urllib.request.urlopen(url, timeout=6) as resp:
-                body = resp.read().decode("utf-8")
-            parsed = json.loads(body)
+            parsed, err = _cached_query(
+                ("rest", url),
+                QUERY_CACHE_TTL_S,
+                lambda: _http_get_json(url),
+                keep=lambda res: res[1] is None,
+            )
+            if err:
+                raise RuntimeError(err)
             entries = parsed.get("services") or parsed.get("service") or []
             services = []
             for item in entries:
                 if not isinstance(item, dict):
                     continue
-                sid = item.get("id") or item.get("service_id") or item.get("serviceID")
-                name = item.get("service") or item.get("name") or item.get("label")
-                desc = item.get("description") or item.get("desc") or ""
-                stype = item.get("service_type") or item.get("type") or ""
+                sid = _pick(item, "id")
+                name = _pick(item, "name")
+                desc = _pick(item, "description") or ""
+                stype = _pick(item, "service_type") or ""
                 if sid is None and name is None:
                     continue
                 services.append({"id": sid, "name": name, "description": desc, "service_type": stype})
@@ -3489,27 +4154,18 @@ def list_services():
     for item in candidates:
         if not isinstance(item, dict):
             continue
-        sid = item.get("id") or item.get("service_id") or item.get("serviceID")
-        name = item.get("service") or item.get("name") or item.get("label")
-        desc = item.get("description") or item.get("desc") or ""
+        sid = _pick(item, "id")
+        name = _pick(item, "name")
         if sid is None and name is None:
             continue
-        stype = (
-            item.get("service_type")
-            or item.get("type")
-            or item.get("service_type_name")
-            or item.get("serviceType")
-            or ""
-        )
+        desc = _pick(item, "description") or ""
+        stype = _pick(item, "service_type") or ""
         services.append({"id": sid, "name": name, "description": desc, "service_type": stype})
 
     # If parsing failed, try to extract minimal info from text lines
     if not services and isinstance(parsed, str):
-        text_pattern = re.compile(
-            r"^\s*-\s*(?P<service>[^:]+?)\s*:\s*(?P<id>[0-9]+)\s*\\((?P<desc>.*)\\)\\s*$"
-        )
         for line in parsed.splitlines():
-            m = text_pattern.match(line)
+            m = _SERVICE_LINE_RE.match(line)
             if not m:
                 continue
             sid = m.group("id").strip()
@@ -3550,15 +4206,8 @@ def provider_services():
     data = payload.get("data")
     providers = _extract_providers_list(data)
 
-    matched = []
-    for p in providers:
-        if not isinstance(p, dict):
-            continue
-        pk = p.get("pub_key") or p.get("pubkey") or p.get("pubKey")
-        if pk and pk == bech32_pubkey:
-            matched.append(p)
+    matched = [p for p in providers if isinstance(p, dict) and bech32_pubkey and _pick(p, "pubkey") == bech32_pubkey]
 
-    services = []
     def _rate_to_string(rate_val):
         """Normalize rate structures into a compact string."""
         if isinstance(rate_val, list):
@@ -3580,73 +4229,35 @@ def provider_services():
             return f"{amount}{denom}"
         return str(rate_val) if rate_val is not None else ""
 
+    def _service_row(s: dict, provider: dict) -> dict:
+        # Normalized id/name: if id missing, fall back to service field
+        return {
+            "name": _pick(s, "provider_service_name"),
+            "id": _pick(s, "provider_service_id"),
+            "service": s.get("service"),
+            "metadata_uri": _pick(s, "metadata_uri"),
+            "metadata_nonce": _pick(s, "metadata_nonce"),
+            "status": s.get("status"),
+            "min_contract_dur": _pick(s, "min_dur"),
+            "max_contract_dur": _pick(s, "max_dur"),
+            "subscription_rates": _rate_to_string(_pick(s, "sub_rate")),
+            "pay_as_you_go_rates": _rate_to_string(_pick(s, "paygo_rate")),
+            "settlement_dur": _pick(s, "settle"),
+            "bond": s.get("bond") or provider.get("bond"),
+        }
+
+    services = []
     for p in matched:
         svc_list = []
         if isinstance(p.get("services"), list):
             svc_list = p.get("services")
         elif isinstance(p.get("service"), list):
             svc_list = p.get("service")
-        # If the provider entry itself looks like a single service entry
         if svc_list:
-            for s in svc_list:
-                if not isinstance(s, dict):
-                    continue
-                min_dur = s.get("min_contract_duration") or s.get("min_contract_dur")
-                max_dur = s.get("max_contract_duration") or s.get("max_contract_dur")
-                sub_rate_raw = s.get("subscription_rate") or s.get("subscription_rates")
-                paygo_rate_raw = s.get("pay_as_you_go_rate") or s.get("pay_as_you_go_rates")
-                sub_rate = _rate_to_string(sub_rate_raw)
-                paygo_rate = _rate_to_string(paygo_rate_raw)
-                settle = s.get("settlement_duration") or s.get("settlement_dur")
-                status_val = s.get("status")
-                # Normalized id/name: if id missing, fall back to service field
-                sid = s.get("service_id") or s.get("id") or s.get("service")
-                sname = s.get("service") or s.get("name")
-                bond_val = s.get("bond") or p.get("bond")
-                services.append(
-                    {
-                        "name": sname,
-                        "id": sid,
-                        "service": s.get("service"),
-                        "metadata_uri": s.get("metadata_uri") or s.get("metadataUri"),
-                        "metadata_nonce": s.get("metadata_nonce") or s.get("metadataNonce"),
-                        "status": status_val,
-                        "min_contract_dur": min_dur,
-                        "max_contract_dur": max_dur,
-                        "subscription_rates": sub_rate,
-                        "pay_as_you_go_rates": paygo_rate,
-                        "settlement_dur": settle,
-                        "bond": bond_val,
-                    }
-                )
+            services.extend(_service_row(s, p) for s in svc_list if isinstance(s, dict))
         else:
-            min_dur = p.get("min_contract_duration") or p.get("min_contract_dur")
-            max_dur = p.get("max_contract_duration") or p.get("max_contract_dur")
-            sub_rate_raw = p.get("subscription_rate") or p.get("subscription_rates")
-            paygo_rate_raw = p.get("pay_as_you_go_rate") or p.get("pay_as_you_go_rates")
-            sub_rate = _rate_to_string(sub_rate_raw)
-            paygo_rate = _rate_to_string(paygo_rate_raw)
-            settle = p.get("settlement_duration") or p.get("settlement_dur")
-            status_val = p.get("status")
-            sid = p.get("service_id") or p.get("id") or p.get("service")
-            sname = p.get("service") or p.get("name")
-            bond_val = p.get("bond")
-            services.append(
-                {
-                    "name": sname,
-                    "id": sid,
-                    "service": p.get("service"),
-                    "metadata_uri": p.get("metadata_uri") or p.get("metadataUri"),
-                    "metadata_nonce": p.get("metadata_nonce") or p.get("metadataNonce"),
-                    "status": status_val,
-                    "min_contract_dur": min_dur,
-                    "max_contract_dur": max_dur,
-                    "subscription_rates": sub_rate,
-                    "pay_as_you_go_rates": paygo_rate,
-                    "settlement_dur": settle,
-                    "bond": bond_val,
-                }
-            )
+            # The provider entry itself looks like a single service entry
+            services.append(_service_row(p, p))
 
     return jsonify(
         {
@@ -3658,32 +4269,155 @@ def provider_services():
     )
 
 
-@app.get("/api/sentinel-status")
-def sentinel_status():
-    """Return sentinel process status (supervisor + short logs)."""
-    status = ""
-    log_tail = ""
-    err_tail = ""
+def _supervisor_fault_text(program: str, fault: xmlrpc.client.Fault) -> str:
+    """Render an XML-RPC fault the way supervisorctl prints it."""
+    names = {
+        SupervisorFaults.BAD_NAME: "no such process",
+        SupervisorFaults.NOT_RUNNING: "not running",
+        SupervisorFaults.ALREADY_STARTED: "already started",
+        SupervisorFaults.SPAWN_ERROR: "spawn error",
+        SupervisorFaults.ABNORMAL_TERMINATION: "abnormal termination",
+    }
+    return f"{program}: ERROR ({names.get(fault.faultCode, fault.faultString)})\n"
+
+
+if SupervisorTransport is not None:
+
+    class _UnixSocketConnection(UnixStreamHTTPConnection):
+        """UnixStreamHTTPConnection that honours the connection timeout."""
+
+        def connect(self):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(self.timeout)
+            self.sock.connect(self.socketfile)
+
+    class _TimeoutSupervisorTransport(SupervisorTransport):
+        """SupervisorTransport whose socket operations give up after timeout seconds."""
+
+        def __init__(self, serverurl: str, timeout: float):
+            super().__init__(None, None, serverurl=serverurl)
+            make_conn = self._get_connection
+
+            def get_connection():
+                if serverurl.startswith("unix://"):
+                    conn = _UnixSocketConnection("localhost", timeout=timeout)
+                    conn.socketfile = serverurl[7:]
+                else:
+                    conn = make_conn()
+                    conn.timeout = timeout
+                return conn
+
+            self._get_connection = get_connection
+
+
+def _supervisor_rpc_action(action: str, program: str) -> tuple[int, str]:
+    """status/start/stop/restart over supervisord's XML-RPC socket; output mirrors supervisorctl."""
+    # SupervisorTransport holds one connection and is not thread-safe, so use a fresh one per call;
+    # the timeout keeps the SUPERVISORCTL_TIMEOUT_S bound a wedged supervisord must not exceed
+    transport = _TimeoutSupervisorTransport(SUPERVISOR_SERVERURL, SUPERVISORCTL_TIMEOUT_S)
     try:
-        code, out = run_list([*SUPERVISORCTL, "status", "sentinel"])
-        status = out.strip()
-    except Exception:
+        sv = xmlrpc.client.ServerProxy("http://127.0.0.1", transport=transport).supervisor
+        if action == "status":
+            try:
+                info = sv.getProcessInfo(program)
+            except xmlrpc.client.Fault as e:
+                return 4, _supervisor_fault_text(program, e)
+            # supervisorctl's status template: name padded to max(len, 30) + 3, state to 10
+            name = info["name"] if info["group"] == info["name"] else f"{info['group']}:{info['name']}"
+            line = f"{name:<{max(len(name), 30) + 3}}{info['statename']:<10}{info['description']}\n"
+            return (0 if info["statename"] == "RUNNING" else 3), line
+        out = ""
+        if action in ("stop", "restart"):
+            try:
+                sv.stopProcess(program)
+                out += f"{program}: stopped\n"
+            except xmlrpc.client.Fault as e:
+                # restart of a stopped program just starts it, like supervisorctl
+                if action == "stop" or e.faultCode != SupervisorFaults.NOT_RUNNING:
+                    return 1, out + _supervisor_fault_text(program, e)
+        if action in ("start", "restart"):
+            try:
+                sv.startProcess(program)
+                out += f"{program}: started\n"
+            except xmlrpc.client.Fault as e:
+                return 1, out + _supervisor_fault_text(program, e)
+        return 0, out
+    finally:
+        transport.close()
+
+
+def _supervisorctl(action: str, program: str = "sentinel") -> tuple[int, str]:
+    """Run a supervisorctl action for program, via XML-RPC when available; returns (exit_code, output)."""
+    if SupervisorTransport is not None:
+        try:
+            return _supervisor_rpc_action(action, program)
+        except socket.timeout:
+            # supervisord accepted but is not answering; supervisorctl would hang on it just the same
+            app.logger.warning("supervisord XML-RPC %s %s timed out after %ss", action, program, SUPERVISORCTL_TIMEOUT_S)
+            return 124, f"{program}: ERROR (timeout after {SUPERVISORCTL_TIMEOUT_S}s)\n"
+        except (OSError, http.client.HTTPException, xmlrpc.client.ProtocolError) as e:
+            app.logger.warning("supervisord XML-RPC unavailable (%s); falling back to supervisorctl", e)
+    cmd = SUPERVISORCTL if os.path.isfile(SUPERVISOR_CONF) else SUPERVISORCTL_FALLBACK
+    return run_list([*cmd, action, program], timeout=SUPERVISORCTL_TIMEOUT_S)
+
+
+def _invalidate_sentinel_status() -> None:
+    """Force the next sentinel-status poll to re-read supervisor state."""
+    with _SENTINEL_STATUS_LOCK:
+        _SENTINEL_STATUS_CACHE["ts"] = 0.0
+        _SENTINEL_STATUS_CACHE["gen"] += 1
+
+
+def _sentinel_status_payload() -> dict:
+    """Collect supervisor status and short log tails for the sentinel."""
+
+    def _status() -> str:
         try:
-            code, out = run_list([*SUPERVISORCTL_FALLBACK, "status", "sentinel"])
-            status = out.strip()
+            code, out = _supervisorctl("status")
+            return out.strip()
         except Exception as e:
-            status = f"status error: {e}"
+            return f"status error: {e}"
+
+    # supervisorctl is the slow part; read the log tails while it runs
+    status_future = _IO_POOL.submit(_status)
+    log_tail = ""
+    err_tail = ""
     try:
-        code, out = run_list(["tail", "-n", "80", "/var/log/provider-sentinel.log"])
-        log_tail = out
+        log_tail = _tail(SENTINEL_LOG, LOG_TAIL_LINES)
     except Exception as e:
         log_tail = f"log error: {e}"
     try:
-        code, out = run_list(["tail", "-n", "80", "/var/log/provider-sentinel.err.log"])
-        err_tail = out
+        err_tail = _tail(SENTINEL_ERR_LOG, LOG_TAIL_LINES)
     except Exception as e:
         err_tail = f"errlog error: {e}"
-    return jsonify({"status": status, "log": log_tail, "err_log": err_tail})
+    return {"status": status_future.result(), "log": log_tail, "err_log": err_tail}
+
+
+@app.get("/api/sentinel-status")
+def sentinel_status():
+    """Return sentinel process status (supervisor + short logs)."""
+    cache = _SENTINEL_STATUS_CACHE
+    with _SENTINEL_STATUS_LOCK:
+        val = cache["val"]
+        age = time.monotonic() - cache["ts"]
+        if val is not None and (
+            age < SENTINEL_STATUS_TTL_S
+            or (age < SENTINEL_STATUS_MAX_STALE_S and _SENTINEL_STATUS_REFRESH.locked())
+        ):
+            # fresh, or recently fresh while another request refreshes: serve what we have
+            return jsonify(val)
+    with _SENTINEL_STATUS_REFRESH:
+        with _SENTINEL_STATUS_LOCK:
+            if cache["val"] is not None and time.monotonic() - cache["ts"] < SENTINEL_STATUS_TTL_S:
+                return jsonify(cache["val"])
+            gen = cache["gen"]
+        val = _sentinel_status_payload()
+        with _SENTINEL_STATUS_LOCK:
+            # an invalidation landed mid-refresh; this result may predate it, so leave the cache cold
+            if cache["gen"] == gen:
+                cache["val"] = val
+                cache["ts"] = time.monotonic()
+    return jsonify(val)
 
 
 @app.post("/api/sentinel-control")
@@ -3694,14 +4428,11 @@ def sentinel_control():
     if action not in {"start", "stop", "restart"}:
         return jsonify({"error": "action must be one of start, stop, restart"}), 400
     try:
-        code, out = run_list([*SUPERVISORCTL, action, "sentinel"])
-        return jsonify({"status": "ok", "action": action, "exit_code": code, "output": out})
-    except Exception:
-        try:
-            code, out = run_list([*SUPERVISORCTL_FALLBACK, action, "sentinel"])
-            return jsonify({"status": "ok", "action": action, "exit_code": code, "output": out})
-        except Exception as e:
-            return jsonify({"error": f"failed to {action} sentinel", "detail": str(e)}), 500
+        code, out = _supervisorctl(action)
+    except Exception as e:
+        return jsonify({"error": f"failed to {action} sentinel", "detail": str(e)}), 500
+    _invalidate_sentinel_status()
+    return jsonify({"status": "ok", "action": action, "exit_code": code, "output": out})
 
 
 @app.get("/api/sentinel-metadata")
@@ -3721,65 +4452,122 @@ def sentinel_metadata():
         url = request.args.get("url") or request.args.get("sentinel_uri") or SENTINEL_URI_DEFAULT
     if not url:
         return jsonify({"error": "sentinel uri not provided"}), 400
-    try:
-        with urllib.request.urlopen(url, timeout=5) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
-    except urllib.error.URLError as e:
+    # Dashboards poll this; the shared pool keeps the sentinel connection open between calls
+    http_status, raw, err = _http_get(url, timeout=5.0)
+    if err is None and http_status >= 400:
+        err = f"HTTP Error {http_status}"
+    if err is not None:
         status = 200 if quiet else 500
-        return jsonify({"error": "failed to fetch sentinel metadata", "detail": str(e), "url": url}), status
+        return jsonify({"error": "failed to fetch sentinel metadata", "detail": err, "url": url}), status
+    body = raw.decode("utf-8", errors="replace")
     parsed = None
     try:
-        parsed = json.loads(body)
-    except json.JSONDecodeError:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         parsed = None
     if parsed is None:
         return jsonify({"url": url, "raw": body})
     return jsonify({"url": url, "metadata": parsed})
 
 
+# path -> (_file_stamp, parsed) for config files that are re-read on nearly every request
+_FILE_CACHE: dict[str, tuple[tuple[int, int, int, int], object]] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _read_parsed(path: str, parse):
+    """Return parse(text) for path, re-parsing only when its stat stamp changes; None if missing."""
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return None
+    with _FILE_CACHE_LOCK:
+        hit = _FILE_CACHE.get(path)
+    if hit and hit[0] == stamp:
+        return hit[1]
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    value = parse(text)
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[path] = (stamp, value)
+    return value
+
+
+def _parse_sentinel_yaml(raw: str) -> tuple[object, str]:
+    try:
+        return yaml.load(raw, Loader=YamlSafeLoader), raw
+    except yaml.YAMLError:
+        return None, raw
+
+
 def _load_sentinel_config():
     """Load sentinel YAML config if present."""
-    if not SENTINEL_CONFIG_PATH or not os.path.isfile(SENTINEL_CONFIG_PATH):
+    if not SENTINEL_CONFIG_PATH:
         return None, None
     try:
-        with open(SENTINEL_CONFIG_PATH, "r", encoding="utf-8") as f:
-            raw = f.read()
-        try:
-            parsed = yaml.safe_load(raw)
-        except yaml.YAMLError:
-            parsed = None
-        return parsed, raw
+        hit = _read_parsed(SENTINEL_CONFIG_PATH, _parse_sentinel_yaml)
     except OSError:
         return None, None
+    if hit is None:
+        return None, None
+    parsed, raw = hit
+    # callers edit the parsed tree in place; keep the cached copy pristine
+    return copy.deepcopy(parsed), raw
 
 
-def _load_env_file(path: str) -> dict:
+def _parse_env_text(text: str) -> dict[str, str]:
     data: dict[str, str] = {}
-    if not path or not os.path.isfile(path):
-        return data
+    for m in _ENV_LINE_RE.finditer(text):
+        key, single, double, bare = m.groups()
+        data[key] = single if single is not None else double if double is not None else bare
+    return data
+
+
+def _load_env_file(path: str) -> dict:
+    if not path:
+        return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                k, v = line.split("=", 1)
-                v = v.strip()
-                if (v.startswith("'") and v.endswith("'")) or (v.startswith('"') and v.endswith('"')):
-                    v = v[1:-1]
-                data[k.strip()] = v
+        data = _read_parsed(path, _parse_env_text)
     except OSError:
-        pass
-    return data
+        return {}
+    return dict(data) if data else {}
+
+def _write_bytes_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a unique temp file + rename so readers never see a torn file."""
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".")
+    try:
+        try:
+            os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    # Our own writes never rely on the stat stamp to invalidate the parsed copy
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.pop(path, None)
+
+def _write_text_atomic(path: str, text: str) -> None:
+    _write_bytes_atomic(path, text.encode("utf-8"))
+
+def _format_env_file(data: dict) -> str:
+    """Render KEY=value lines, quoting values so they stay intact when sourced."""
+    return "".join(f"{k}={shlex.quote(str(v))}\n" for k, v in data.items())
 
 def _write_env_file(path: str, data: dict) -> None:
     """Write env-style file from a dict."""
     if not path or not isinstance(data, dict):
         return
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            for k, v in data.items():
-                f.write(f"{k}={shlex.quote(str(v))}\n")
+        _write_text_atomic(path, _format_env_file(data))
     except OSError:
         pass
 
@@ -3914,18 +4702,21 @@ def _origin_allowed(origin: str | None) -> bool:
     return False
 
 
-def _cors_headers():
-    origin = request.headers.get("Origin")
-    headers = {}
-    allow_origin = origin or ADMIN_UI_ORIGIN
-    if allow_origin:
-        headers["Access-Control-Allow-Origin"] = allow_origin
-        headers["Vary"] = "Origin"
-        headers["Access-Control-Allow-Credentials"] = "true"
-        headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization, X-Requested-With, Cache-Control"
-        headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-        headers["Access-Control-Max-Age"] = "3600"
-    return headers
+# Origin is reflected per request (credentialed CORS cannot use "*"); the rest is fixed
+_CORS_STATIC_HEADERS = (
+    ("Vary", "Origin"),
+    ("Access-Control-Allow-Credentials", "true"),
+    ("Access-Control-Allow-Headers", "Content-Type, Authorization, X-Requested-With, Cache-Control"),
+    ("Access-Control-Allow-Methods", "GET, POST, OPTIONS"),
+    ("Access-Control-Max-Age", "3600"),
+)
+
+
+def _cors_headers() -> tuple[tuple[str, str], ...]:
+    allow_origin = request.headers.get("Origin") or ADMIN_UI_ORIGIN
+    if not allow_origin:
+        return ()
+    return (("Access-Control-Allow-Origin", allow_origin), *_CORS_STATIC_HEADERS)
 
 
 def _default_provider_settings() -> dict:
@@ -3943,6 +4734,7 @@ def _default_provider_settings() -> dict:
         "ADMIN_PORT": os.getenv("ADMIN_PORT") or DEFAULT_ADMIN_PORT,
         "ADMIN_API_PORT": os.getenv("ADMIN_API_PORT") or DEFAULT_ADMIN_API_PORT,
         "OSMOSIS_RPC": _strip_quotes(os.getenv("OSMOSIS_RPC") or DEFAULT_OSMOSIS_RPC),
+        "OSMOSIS_REST": _strip_quotes(os.getenv("OSMOSIS_REST") or ""),
         "OSMOSIS_USDC_DENOMS": OSMOSIS_USDC_DENOMS,
         "USDC_OSMO_DENOM": os.getenv("USDC_OSMO_DENOM", "ibc/498A0751C798A0D9A389AA3691123DADA57DAA4FE165D5C75894505B876BA6E4"),
         "ARKEO_OSMO_DENOM": os.getenv("ARKEO_OSMO_DENOM", "ibc/AD969E97A63B64B30A6E4D9F598341A403B849F5ACFEAA9F18DBD9255305EC65"),
@@ -3999,7 +4791,7 @@ def _merge_provider_settings(overrides: dict | None = None) -> dict:
 
 def _apply_provider_settings(settings: dict) -> None:
     """Apply provider settings to globals and os.environ for runtime use."""
-    global KEY_NAME, KEYRING, ARKEOD_HOME, ARKEOD_NODE, CHAIN_ID, NODE_ARGS, CHAIN_ARGS, OSMOSIS_RPC, OSMOSIS_USDC_DENOMS, MIN_OSMO_GAS, DEFAULT_SLIPPAGE_BPS, OSMO_TO_ARKEO_CHANNEL, ARKEO_TO_OSMO_CHANNEL
+    global KEY_NAME, KEYRING, ARKEOD_HOME, ARKEOD_NODE, CHAIN_ID, NODE_ARGS, CHAIN_ARGS, OSMOSIS_RPC, OSMOSIS_REST, OSMOSIS_USDC_DENOMS, MIN_OSMO_GAS, DEFAULT_SLIPPAGE_BPS, OSMO_TO_ARKEO_CHANNEL, ARKEO_TO_OSMO_CHANNEL
     if not isinstance(settings, dict):
         return
     KEY_NAME = settings.get("KEY_NAME", KEY_NAME)
@@ -4022,6 +4814,7 @@ def _apply_provider_settings(settings: dict) -> None:
     except Exception:
         OSMOSIS_USDC_DENOMS = DEFAULT_OSMOSIS_USDC_DENOMS.copy()
     OSMOSIS_RPC = _ensure_rpc_port(_strip_quotes(settings.get("OSMOSIS_RPC") or OSMOSIS_RPC or ""), default_port="26657")
+    OSMOSIS_REST = _strip_quotes(settings.get("OSMOSIS_REST", OSMOSIS_REST) or "")
     OSMO_TO_ARKEO_CHANNEL = "channel-103074"
     ARKEO_TO_OSMO_CHANNEL = "channel-1"
 
@@ -4038,6 +4831,7 @@ def _apply_provider_settings(settings: dict) -> None:
         "ADMIN_API_PORT": settings.get("ADMIN_API_PORT", ""),
         "KEY_MNEMONIC": settings.get("KEY_MNEMONIC", ""),
         "OSMOSIS_RPC": settings.get("OSMOSIS_RPC", ""),
+        "OSMOSIS_REST": OSMOSIS_REST,
         "OSMOSIS_USDC_DENOMS": ",".join(OSMOSIS_USDC_DENOMS) if OSMOSIS_USDC_DENOMS else "",
         "USDC_OSMO_DENOM": settings.get("USDC_OSMO_DENOM", ""),
         "ARKEO_OSMO_DENOM": settings.get("ARKEO_OSMO_DENOM", ""),
@@ -4110,7 +4904,9 @@ def _delete_hotwallet(key_name: str, keyring_backend: str, home: str) -> tuple[i
         "--force",
         "--yes",
     ]
-    return run_list(cmd, timeout=KEY_OP_TIMEOUT_S)
+    result = run_list(cmd, timeout=KEY_OP_TIMEOUT_S)
+    _flush_pubkey_cache()
+    return result
 
 
 def _import_hotwallet_from_mnemonic(
@@ -4128,7 +4924,9 @@ def _import_hotwallet_from_mnemonic(
         key_name,
         "--recover",
     ]
-    return run_with_input(cmd, mnemonic.strip() + "\n", timeout=KEY_OP_TIMEOUT_S)
+    result = run_with_input(cmd, mnemonic.strip() + "\n", timeout=KEY_OP_TIMEOUT_S)
+    _flush_pubkey_cache()
+    return result
 
 
 def _create_hotwallet(
@@ -4148,6 +4946,7 @@ def _create_hotwallet(
         key_name,
     ]
     code, out = run_list(cmd, timeout=KEY_OP_TIMEOUT_S)
+    _flush_pubkey_cache()
     mnemonic = _extract_mnemonic(out)
     return code, out, mnemonic
 
@@ -4167,8 +4966,7 @@ def _sync_sentinel_pubkey(bech32_pubkey: str) -> bool:
         parsed["provider"] = provider
     provider["pubkey"] = bech32_pubkey
     try:
-        with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(parsed, f, sort_keys=False)
+        _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(parsed, Dumper=YamlSafeDumper, sort_keys=False))
         updated_any = True
     except OSError:
         pass
@@ -4177,9 +4975,7 @@ def _sync_sentinel_pubkey(bech32_pubkey: str) -> bool:
     try:
         env_file = _load_env_file(SENTINEL_ENV_PATH)
         env_file["PROVIDER_PUBKEY"] = bech32_pubkey
-        with open(SENTINEL_ENV_PATH, "w", encoding="utf-8") as f:
-            for k, v in env_file.items():
-                f.write(f"{k}={shlex.quote(str(v))}\n")
+        _write_text_atomic(SENTINEL_ENV_PATH, _format_env_file(env_file))
         updated_any = True
     except Exception:
         pass
@@ -4248,20 +5044,19 @@ def _fetch_provider_services_internal(bech32_pubkey: str) -> list[dict]:
     if rest_base:
         try:
             url = f"{rest_base}/arkeo/services"
-            with urllib.request.urlopen(url, timeout=6) as resp:
-                body = resp.read().decode("utf-8")
-            data = json.loads(body)
+            data, err = _http_get_json(url)
+            if err:
+                raise RuntimeError(err)
             entries = data.get("services") or data.get("service") or []
             services: list[dict] = []
             for s in entries:
                 if not isinstance(s, dict):
                     continue
-                provider_pk = s.get("provider") or s.get("provider_pubkey") or s.get("provider_pub_key")
-                if provider_pk != bech32_pubkey:
+                if _pick(s, "provider") != bech32_pubkey:
                     continue
-                sid = s.get("service_id") or s.get("id") or s.get("service")
-                sname = s.get("service") or s.get("name")
-                stype = s.get("service_type") or s.get("type") or s.get("service_type_name") or ""
+                sid = _pick(s, "provider_service_id")
+                sname = _pick(s, "provider_service_name")
+                stype = _pick(s, "service_type") or ""
                 services.append(
                     {
                         "id": sid,
@@ -4285,8 +5080,7 @@ def _fetch_provider_services_internal(bech32_pubkey: str) -> list[dict]:
     for p in providers:
         if not isinstance(p, dict):
             continue
-        pk = p.get("pub_key") or p.get("pubkey") or p.get("pubKey")
-        if pk != bech32_pubkey:
+        if _pick(p, "pubkey") != bech32_pubkey:
             continue
         entries = []
         if isinstance(p.get("services"), list):
@@ -4298,12 +5092,10 @@ def _fetch_provider_services_internal(bech32_pubkey: str) -> list[dict]:
         for s in entries:
             if not isinstance(s, dict):
                 continue
-            sid = s.get("service_id") or s.get("id") or s.get("service")
-            sname = s.get("service") or s.get("name")
             services.append(
                 {
-                    "id": sid,
-                    "name": sname,
+                    "id": _pick(s, "provider_service_id"),
+                    "name": _pick(s, "provider_service_name"),
                     "status": s.get("status"),
                 }
             )
@@ -4363,18 +5155,10 @@ def _all_services_lookup() -> dict[str, dict]:
     for item in services:
         if not isinstance(item, dict):
             continue
-        sid = item.get("id") or item.get("service_id") or item.get("serviceID")
-        name = item.get("name") or item.get("service") or item.get("label")
-        stype = (
-            item.get("service_type")
-            or item.get("type")
-            or item.get("service_type_name")
-            or item.get("serviceType")
-            or ""
-        )
+        sid = _pick(item, "id")
         if sid is None:
             continue
-        lookup[str(sid)] = {"name": name, "service_type": stype}
+        lookup[str(sid)] = {"name": _pick(item, "catalog_name"), "service_type": _pick(item, "service_type") or ""}
     return lookup
 
 
@@ -4554,8 +5338,7 @@ def sentinel_rebuild():
     parsed["api"] = api_cfg or {"listen_addr": f"0.0.0.0:{fallback_port}"}
 
     try:
-        with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(parsed, f, sort_keys=False)
+        _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(parsed, Dumper=YamlSafeDumper, sort_keys=False))
     except OSError as e:
         _emit_sentinel_rebuild_failed(f"failed to write sentinel config: {e}", target)
         return jsonify({"error": "failed to write sentinel config", "detail": str(e)}), 500
@@ -4576,10 +5359,16 @@ def sentinel_rebuild():
     )
 
 
+def _env_snapshot(fields: tuple[tuple[str, str], ...]) -> dict:
+    """Read the given (name, env var) pairs from os.environ in one pass."""
+    env = os.environ
+    return {name: env.get(key) for name, key in fields}
+
+
 @app.get("/api/sentinel-config")
 def sentinel_config():
     """Return sentinel-related env values and parsed sentinel.yaml if present."""
-    env_data = {k.lower(): os.getenv(k) for k in ENV_EXPORT_KEYS}
+    env_data = _env_snapshot(_ENV_EXPORT_FIELDS)
     export_bundle = _load_export_bundle()
     # Prefer the live sentinel.env on disk; fall back to any cached export bundle
     env_file = _load_env_file(SENTINEL_ENV_PATH) or ((export_bundle and export_bundle.get("env_file")) or {})
@@ -4750,9 +5539,7 @@ def provider_settings_save():
         env_file = _load_env_file(SENTINEL_ENV_PATH)
         if rest_val:
             env_file["PROVIDER_HUB_URI"] = rest_val
-        with open(SENTINEL_ENV_PATH, "w", encoding="utf-8") as f:
-            for k, v in env_file.items():
-                f.write(f"{k}={shlex.quote(str(v))}\n")
+        _write_text_atomic(SENTINEL_ENV_PATH, _format_env_file(env_file))
         app.logger.info("provider-settings-save id=%s step=sync_rest_env", req_id)
     except Exception:
         app.logger.warning("provider-settings-save: failed to sync PROVIDER_HUB_URI to sentinel env", exc_info=True)
@@ -4766,16 +5553,13 @@ def provider_settings_save():
         env_file["PORT"] = sentinel_port
         if sentinel_node:
             env_file["SENTINEL_NODE"] = sentinel_node
-        with open(SENTINEL_ENV_PATH, "w", encoding="utf-8") as f:
-            for k, v in env_file.items():
-                f.write(f"{k}={shlex.quote(str(v))}\n")
+        _write_text_atomic(SENTINEL_ENV_PATH, _format_env_file(env_file))
         cfg, _ = _load_sentinel_config()
         if not isinstance(cfg, dict):
             cfg = {}
         api_cfg = cfg.setdefault("api", {})
         api_cfg["listen_addr"] = f"0.0.0.0:{sentinel_port}"
-        with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(cfg, f, sort_keys=False)
+        _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(cfg, Dumper=YamlSafeDumper, sort_keys=False))
         app.logger.info("provider-settings-save id=%s step=sync_sentinel_port", req_id)
     except Exception:
         app.logger.warning("provider-settings-save: failed to sync sentinel port", exc_info=True)
@@ -4965,7 +5749,7 @@ def import_provider_bundle():
     raw_cfg = sentinel_cfg_raw
     if sentinel_cfg_raw:
         try:
-            parsed_cfg = yaml.safe_load(sentinel_cfg_raw) or {}
+            parsed_cfg = yaml.load(sentinel_cfg_raw, Loader=YamlSafeLoader) or {}
         except Exception:
             parsed_cfg = None
     elif sentinel_cfg_obj:
@@ -4983,29 +5767,25 @@ def import_provider_bundle():
             parsed_cfg["services"] = filtered_services
         skipped_services = skipped
         try:
-            raw_cfg = yaml.safe_dump(parsed_cfg, sort_keys=False)
+            raw_cfg = yaml.dump(parsed_cfg, Dumper=YamlSafeDumper, sort_keys=False)
         except Exception:
             raw_cfg = sentinel_cfg_raw
 
     if raw_cfg:
         try:
-            with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-                f.write(raw_cfg)
+            _write_text_atomic(SENTINEL_CONFIG_PATH, raw_cfg)
         except OSError as e:
             return jsonify({"error": "failed to write sentinel config", "detail": str(e)}), 500
     elif parsed_cfg is not None:
         try:
-            with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-                yaml.safe_dump(parsed_cfg, f, sort_keys=False)
+            _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(parsed_cfg, Dumper=YamlSafeDumper, sort_keys=False))
         except OSError as e:
             return jsonify({"error": "failed to write sentinel config", "detail": str(e)}), 500
 
     # Write sentinel.env if provided
     if isinstance(env_file, dict):
         try:
-            with open(SENTINEL_ENV_PATH, "w", encoding="utf-8") as f:
-                for k, v in env_file.items():
-                    f.write(f"{k}={shlex.quote(str(v))}\n")
+            _write_text_atomic(SENTINEL_ENV_PATH, _format_env_file(env_file))
         except OSError as e:
             return jsonify({"error": "failed to write sentinel env", "detail": str(e)}), 500
 
@@ -5017,10 +5797,11 @@ def import_provider_bundle():
 
     restart_output = ""
     try:
-        code, out = run_list([*SUPERVISORCTL, "restart", "sentinel"])
+        code, out = _supervisorctl("restart")
         restart_output = out
     except Exception as e:
         restart_output = f"restart failed: {e}"
+    _invalidate_sentinel_status()
 
     bundle = _write_export_bundle(
         provider_form=payload.get("provider_form"),
@@ -5057,16 +5838,16 @@ def sentinel_sync():
     filtered_services, skipped, annotated = _filter_sentinel_services_with_onchain(parsed, bech32_pubkey)
     parsed["services"] = filtered_services
     try:
-        with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(parsed, f, sort_keys=False)
+        _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(parsed, Dumper=YamlSafeDumper, sort_keys=False))
     except OSError as e:
         return jsonify({"error": "failed to write sentinel config", "detail": str(e)}), 500
     restart_output = ""
     try:
-        code, out = run_list([*SUPERVISORCTL, "restart", "sentinel"])
+        code, out = _supervisorctl("restart")
         restart_output = out
     except Exception as e:
         restart_output = f"restart failed: {e}"
+    _invalidate_sentinel_status()
     return jsonify(
         {
             "status": "synced",
@@ -5107,12 +5888,14 @@ def update_sentinel_config():
 
     try:
         with open(SENTINEL_CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=YamlSafeLoader) or {}
     except Exception as e:
         return jsonify({"error": "failed to read sentinel config", "detail": str(e)}), 500
+    orig_config = copy.deepcopy(config)
 
     # Update env file for UI-managed fields
     env_file = _load_env_file(SENTINEL_ENV_PATH)
+    orig_env = dict(env_file)
     def _set_env(key, value):
         if value is None:
             return
@@ -5167,29 +5950,37 @@ def update_sentinel_config():
         config["provider"]["name"] = effective_provider_name
     # listen_addr and provider_pubkey are not user-editable in the UI anymore; we keep them unchanged unless provided explicitly
 
+    # Nothing to apply: skip the writes and, more importantly, the sentinel restart
+    if config == orig_config and {k: str(v) for k, v in env_file.items()} == orig_env:
+        return jsonify(
+            {
+                "status": "unchanged",
+                "config_path": SENTINEL_CONFIG_PATH,
+                "config": config,
+                "restart_output": "",
+            }
+        )
+
     try:
-        with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config, f, sort_keys=False)
+        _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(config, Dumper=YamlSafeDumper, sort_keys=False))
     except Exception as e:
         return jsonify({"error": "failed to write sentinel config", "detail": str(e)}), 500
 
     try:
-        with open(SENTINEL_ENV_PATH, "w", encoding="utf-8") as f:
-            for k, v in env_file.items():
-                # Quote values to keep spaces safe when sourced
-                f.write(f"{k}={shlex.quote(str(v))}\n")
+        _write_text_atomic(SENTINEL_ENV_PATH, _format_env_file(env_file))
     except Exception as e:
         return jsonify({"error": "failed to write sentinel env", "detail": str(e)}), 500
 
     restart_output = ""
     try:
-        app.logger.info("Restarting sentinel via supervisorctl")
-        code, out = run_list([*SUPERVISORCTL, "restart", "sentinel"])
+        app.logger.info("Restarting sentinel via supervisor")
+        code, out = _supervisorctl("restart")
         restart_output = out
         app.logger.info("Sentinel restart exited code=%s output=%s", code, out.strip())
     except Exception as e:
         restart_output = f"restart failed: {e}"
         app.logger.warning("Sentinel restart failed: %s", e)
+    _invalidate_sentinel_status()
 
     return jsonify(
         {
@@ -5205,11 +5996,9 @@ def update_sentinel_config():
 def provider_claims():
     """Submit open claims via arkeod using current provider env/config."""
     # Derive provider account address
-    key_cmd = ["arkeod", "--home", ARKEOD_HOME, "keys", "show", KEY_NAME, "--bech", "acc", "--keyring-backend", KEYRING, "--address"]
-    code, out = run_list(key_cmd)
-    if code != 0:
-        return jsonify({"error": "failed to get provider address", "detail": out}), 500
-    provider_account = out.strip()
+    provider_account, addr_err = derive_address(KEY_NAME, KEYRING)
+    if addr_err is not None:
+        return jsonify({"error": "failed to get provider address", "detail": addr_err}), 500
 
     # Sentinel API (open-claims / mark-claimed)
     sentinel_port = os.getenv("SENTINEL_PORT") or DEFAULT_SENTINEL_PORT
@@ -5217,25 +6006,11 @@ def provider_claims():
     sentinel_api = f"http://{sentinel_host}:{sentinel_port}"
 
     def current_sequence():
-        qcmd = ["arkeod", "--home", ARKEOD_HOME, "query", "auth", "account", provider_account, "-o", "json", *NODE_ARGS]
-        c, o = run_list(qcmd)
-        if c != 0:
-            return None, o
-        try:
-            data = json.loads(o)
-        except Exception:
-            return None, o
-        seq = (
-            data.get("account", {})
-            .get("base_account", {})
-            .get("sequence")
-            or data.get("account", {})
-            .get("value", {})
-            .get("sequence")
-            or data.get("account", {})
-            .get("sequence")
-        )
-        return seq, o
+        # Each claim advances the sequence, so always read fresh (over the pooled LCD connection)
+        seq = _fetch_account_sequence(provider_account, nocache=True)
+        if seq is None:
+            return None, f"could not read account sequence for {provider_account}"
+        return seq, ""
 
     def fetch_open_claims():
         try:
@@ -5376,7 +6151,7 @@ def provider_claims():
                 raw_log = tx_json.get("raw_log") or tx_json.get("rawlog") or ""
             if "account sequence mismatch" in str(raw_log):
                 expected = None
-                m = re.search(r"expected\s+(\d+)", str(raw_log))
+                m = _EXPECTED_SEQ_RE.search(str(raw_log))
                 if m:
                     expected = m.group(1)
                 if expected is not None:
@@ -5466,12 +6241,9 @@ def claims_ledger():
         pass
     bech_pub = ""
     if raw_pub:
-        c2, o2 = run_list(["arkeod", "debug", "pubkey-raw", raw_pub])
+        c2, o2 = run_list_bytes(["arkeod", "debug", "pubkey-raw", raw_pub])
         if c2 == 0:
-            for line in o2.splitlines():
-                if "Bech32 Acc:" in line:
-                    bech_pub = line.split("Bech32 Acc:")[-1].strip()
-                    break
+            bech_pub = _bech32_acc_from_output(o2)
     provider_pubkey = bech_pub or raw_pub
     provider_pubkey_alts = {provider_pubkey.strip(), raw_pub.strip()}
     if not provider_pubkey:
@@ -5633,12 +6405,9 @@ def provider_contracts_summary():
             raw_pub = ""
         bech_pub = ""
         if raw_pub:
-            c2, o2 = run_list(["arkeod", "debug", "pubkey-raw", raw_pub])
+            c2, o2 = run_list_bytes(["arkeod", "debug", "pubkey-raw", raw_pub])
             if c2 == 0:
-                for line in o2.splitlines():
-                    if "Bech32 Acc:" in line:
-                        bech_pub = line.split("Bech32 Acc:")[-1].strip()
-                        break
+                bech_pub = _bech32_acc_from_output(o2)
         provider_pubkey = bech_pub or raw_pub
         if not provider_pubkey:
             return empty_summary("", "failed to derive provider pubkey", out)
@@ -5889,12 +6658,9 @@ def provider_totals():
         pass
     bech_pub = ""
     if raw_pub:
-        c2, o2 = run_list(["arkeod", "debug", "pubkey-raw", raw_pub])
+        c2, o2 = run_list_bytes(["arkeod", "debug", "pubkey-raw", raw_pub])
         if c2 == 0:
-            for line in o2.splitlines():
-                if "Bech32 Acc:" in line:
-                    bech_pub = line.split("Bech32 Acc:")[-1].strip()
-                    break
+            bech_pub = _bech32_acc_from_output(o2)
     provider_pubkey = bech_pub or raw_pub
     if not provider_pubkey:
         return empty_totals("", "failed to derive provider pubkey", out), 200
@@ -6308,4 +7074,8 @@ def provider_totals():
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=API_PORT)
+    # Production runs under gunicorn via supervisord (see wsgi.py / gunicorn_conf.py);
+    # the Werkzeug dev server is only for local hacking.
+    if not os.getenv("FLASK_DEV"):
+        sys.exit("admin_api: start with `gunicorn --config gunicorn_conf.py wsgi:application` or set FLASK_DEV=1")
+    app.run(host="0.0.0.0", port=API_PORT, threaded=True)
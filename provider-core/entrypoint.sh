@@ -59,6 +59,7 @@ keys = [
     "ADMIN_PORT",
     "ADMIN_API_PORT",
     "OSMOSIS_RPC",
+    "OSMOSIS_REST",
     "OSMOSIS_USDC_DENOMS",
     "USDC_OSMO_DENOM",
     "ARKEO_OSMO_DENOM",
@@ -0,0 +1,19 @@
+"""Gunicorn settings for the admin API (wsgi:application, started by supervisord)."""
+import os
+
+bind = f"0.0.0.0:{os.getenv('ADMIN_API_PORT') or '9999'}"
+
+# Handlers mostly block on arkeod subprocesses and HTTP calls, so threads scale well.
+worker_class = "gthread"
+threads = int(os.getenv("ADMIN_API_THREADS") or 16)
+# A single process by default: runtime settings updates, the pubkey/query caches and the
+# background telemetry threads all live in module globals and would diverge across workers.
+workers = int(os.getenv("ADMIN_API_WORKERS") or 1)
+
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# admin_api logs to stdout itself; gunicorn's error log goes to stderr
+errorlog = "-"
+loglevel = "info"
@@ -0,0 +1,4 @@
+"""WSGI entry point for the admin API (gunicorn --config gunicorn_conf.py wsgi:application)."""
+from admin_api import app
+
+application = app
@@ -12,8 +12,9 @@ import shlex
 import socket
 import socketserver
 import subprocess
+import tempfile
 import threading
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 import time
 import traceback
 import urllib.error
@@ -33,6 +34,11 @@ from cache_fetcher import (
     fetch_once as cache_fetch_once,
     STATUS_FILE as CACHE_STATUS_FILE,
 )
+try:
+    # libyaml-backed safe loader/dumper (python3-yaml ships them); pure Python otherwise
+    from yaml import CSafeDumper as YamlSafeDumper, CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper, SafeLoader as YamlSafeLoader
 
 app = Flask(__name__)
 CONFIG_DIR = os.getenv("CONFIG_DIR", "/app/config")
@@ -873,7 +879,7 @@ def _heuristic_symbol_and_decimals(base_denom: str | None, denom: str) -> tuple[
             return "OSMO", 6
         if b in ("uusdc", "usdc"):
             return "USDC", 6
-        if b in ("uarkeo", "arkeo"):
+        if b in KNOWN_ARKEO_DENOMS:
             return "ARKEO", 8
         if b.startswith("u") and len(b) > 1:
             return b[1:].upper(), 6
@@ -929,23 +935,16 @@ def _resolve_osmo_assets(addr: str) -> tuple[list[dict] | None, str | None]:
             base_denom = trace.get("base_denom")
             path = trace.get("path")
 
-        symbol = None
-        decimals = None
-        if base_denom and base_denom in md_idx:
-            symbol, decimals = md_idx.get(base_denom) or (None, None)
-        elif denom in md_idx:
-            symbol, decimals = md_idx.get(denom) or (None, None)
-        else:
-            symbol, decimals = _heuristic_symbol_and_decimals(base_denom, denom)
-
         # Override known ARKEO to 8 decimals regardless of metadata quirks
-        if (base_denom or "").lower() in ("uarkeo", "arkeo") or denom.lower() == "uarkeo":
-            symbol = "ARKEO"
-            decimals = 8
+        if (base_denom or denom).lower() in KNOWN_ARKEO_DENOMS:
+            symbol, decimals = "ARKEO", 8
+        else:
+            hit = (md_idx.get(base_denom) if base_denom else None) or md_idx.get(denom)
+            symbol, decimals = hit or _heuristic_symbol_and_decimals(base_denom, denom)
 
         display_amount = None
         if decimals is not None:
-            display_amount = amount_int / (10 ** decimals)
+            display_amount = amount_int / (_POW10[decimals] if 0 <= decimals < len(_POW10) else 10**decimals)
         label = symbol
         if is_ibc and symbol:
             label = f"{symbol} (IBC)"
@@ -2360,6 +2359,9 @@ OSMOSIS_KEY_NAME = os.getenv("OSMOSIS_KEY_NAME", "osmo-subscriber")
 CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "*")
 # cache for Osmosis denom traces/metadata
 OSMOSIS_DENOM_CACHE = os.path.join(CACHE_DIR or "/app/cache", "osmo_denom_cache.json")
+# Base denoms that are ARKEO whatever the chain metadata says
+KNOWN_ARKEO_DENOMS = frozenset({"uarkeo", "arkeo"})
+_POW10 = tuple(10**i for i in range(19))
 DEFAULT_OSMOSIS_USDC_DENOMS = [
     # Axelar canonical USDC on Osmosis
     "ibc/27394FB092D2ECCD56123C74F36E4C1F926001CEADA9CA97EA622B25F41E5EB2",
@@ -2389,6 +2391,30 @@ FEES_DEFAULT = os.getenv("TX_FEES") or "200uarkeo"
 API_PORT = int(os.getenv("ADMIN_API_PORT", "9998"))
 SENTINEL_CONFIG_PATH = os.getenv("SENTINEL_CONFIG_PATH", "/app/config/sentinel.yaml")
 SENTINEL_ENV_PATH = os.getenv("SENTINEL_ENV_PATH", "/app/config/sentinel.env")
+# Process env values echoed by /api/sentinel-config
+SENTINEL_ENV_KEYS = (
+    "PROVIDER_NAME",
+    "MONIKER",
+    "WEBSITE",
+    "DESCRIPTION",
+    "LOCATION",
+    "PORT",
+    "SOURCE_CHAIN",
+    "PROVIDER_HUB_URI",
+    "EVENT_STREAM_HOST",
+    "FREE_RATE_LIMIT",
+    "FREE_RATE_LIMIT_DURATION",
+    "CLAIM_STORE_LOCATION",
+    "CONTRACT_CONFIG_STORE_LOCATION",
+    "PROVIDER_CONFIG_STORE_LOCATION",
+    "LOG_LEVEL",
+    "PROVIDER_PUBKEY",
+    "ARKEOD_NODE",
+    "EXTERNAL_ARKEOD_NODE",
+    "SENTINEL_NODE",
+    "SENTINEL_PORT",
+)
+_SENTINEL_ENV_FIELDS = tuple((k.lower(), k) for k in SENTINEL_ENV_KEYS)
 SUBSCRIBER_SETTINGS_PATH = os.getenv("SUBSCRIBER_SETTINGS_PATH") or os.path.join(
     CONFIG_DIR or "/app/config", "subscriber-settings.json"
 )
@@ -2441,26 +2467,11 @@ SQUID_TO_CHAIN_ID = os.getenv("SQUID_TO_CHAIN_ID") or "875"  # default to Osmosi
 os.environ.setdefault("FOUNDRY_DISABLE_NIGHTLY_WARNING", "1")
 
 
-def run(cmd: str) -> tuple[int, str]:
-    """Run a shell command and return (exit_code, output)."""
-    try:
-        out = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT)
-        return 0, out.decode("utf-8")
-    except subprocess.CalledProcessError as e:
-        return e.returncode, e.output.decode("utf-8")
-    except FileNotFoundError as e:
-        return 127, str(e)
-    except Exception as e:
-        return 1, str(e)
-
-
 def run_list(cmd: list[str]) -> tuple[int, str]:
     """Run a command without a shell and return (exit_code, output)."""
     try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-        return 0, out.decode("utf-8")
-    except subprocess.CalledProcessError as e:
-        return e.returncode, e.output.decode("utf-8")
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=False)
+        return proc.returncode, proc.stdout.decode("utf-8", errors="replace") if proc.stdout else ""
     except FileNotFoundError as e:
         return 127, str(e)
     except Exception as e:
@@ -3484,12 +3495,8 @@ def provider_pubkeys_response(user: str, keyring_backend: str):
 
 def derive_address(user: str, keyring_backend: str) -> tuple[str, str | None]:
     """Return (address, error) for the given key."""
-    cmd = (
-        f"arkeod --home {ARKEOD_HOME} "
-        f"--keyring-backend {keyring_backend} "
-        f"keys show {user} -a"
-    )
-    code, out = run(cmd)
+    cmd = ["arkeod", "--home", ARKEOD_HOME, "--keyring-backend", keyring_backend, "keys", "show", user, "-a"]
+    code, out = run_list(cmd)
     if code != 0:
         return "", out
     return out.strip(), None
@@ -3502,7 +3509,7 @@ def ping():
 @app.get("/api/version")
 def version():
     app_version = (os.getenv("APP_VERSION") or "").strip() or "dev"
-    code, out = run("arkeod version")
+    code, out = run_list(["arkeod", "version"])
     response = {"app_version": app_version}
     if code != 0:
         detail = out.strip()
@@ -3812,12 +3819,8 @@ def osmosis_quote_arkeo_to_usdc():
 
 @app.get("/api/key")
 def get_key():
-    cmd = (
-        f"arkeod --home {ARKEOD_HOME} "
-        f"--keyring-backend {KEYRING} "
-        f"keys show {KEY_NAME} -a"
-    )
-    code, out = run(cmd)
+    cmd = ["arkeod", "--home", ARKEOD_HOME, "--keyring-backend", KEYRING, "keys", "show", KEY_NAME, "-a"]
+    code, out = run_list(cmd)
     if code != 0:
         return jsonify({"error": "failed to get key address", "detail": out}), 500
 
@@ -3828,24 +3831,16 @@ def get_key():
 @app.get("/api/balance")
 def get_balance():
     # first get address
-    addr_cmd = (
-        f"arkeod --home {ARKEOD_HOME} "
-        f"--keyring-backend {KEYRING} "
-        f"keys show {KEY_NAME} -a"
-    )
-    code, addr_out = run(addr_cmd)
+    addr_cmd = ["arkeod", "--home", ARKEOD_HOME, "--keyring-backend", KEYRING, "keys", "show", KEY_NAME, "-a"]
+    code, addr_out = run_list(addr_cmd)
     if code != 0:
         return jsonify({"error": "failed to get key address", "detail": addr_out}), 500
 
     address = addr_out.strip()
 
     # then query balances in JSON form
-    bal_cmd = (
-        f"arkeod query bank balances {address} "
-        f"--node {ARKEOD_NODE} "
-        f"-o json"
-    )
-    code, bal_out = run(bal_cmd)
+    bal_cmd = ["arkeod", "query", "bank", "balances", address, "--node", ARKEOD_NODE, "-o", "json"]
+    code, bal_out = run_list(bal_cmd)
 
     if code != 0:
         return jsonify(
@@ -4845,7 +4840,7 @@ def _load_sentinel_config():
         with open(SENTINEL_CONFIG_PATH, "r", encoding="utf-8") as f:
             raw = f.read()
         try:
-            parsed = yaml.safe_load(raw)
+            parsed = yaml.load(raw, Loader=YamlSafeLoader)
         except yaml.YAMLError:
             parsed = None
         return parsed, raw
@@ -4853,26 +4848,58 @@ def _load_sentinel_config():
         return None, None
 
 
+# KEY=value lines of an env file; one layer of matching quotes around the value is dropped
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(?:'([^\n]*)'|"([^\n]*)"|([^\n]*?))[ \t\r]*$""", re.M
+)
+
+
 def _load_env_file(path: str) -> dict:
     data: dict[str, str] = {}
     if not path or not os.path.isfile(path):
         return data
     try:
         with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                k, v = line.split("=", 1)
-                v = v.strip()
-                if (v.startswith("'") and v.endswith("'")) or (v.startswith('"') and v.endswith('"')):
-                    v = v[1:-1]
-                data[k.strip()] = v
+            text = f.read()
     except OSError:
-        pass
+        return data
+    for m in _ENV_LINE_RE.finditer(text):
+        key, single, double, bare = m.groups()
+        data[key] = single if single is not None else double if double is not None else bare
     return data
 
 
+def _write_bytes_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a unique temp file + rename so readers never see a torn file."""
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".")
+    try:
+        try:
+            os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def _write_text_atomic(path: str, text: str) -> None:
+    _write_bytes_atomic(path, text.encode("utf-8"))
+
+
+def _format_env_file(data: dict) -> str:
+    """Render KEY=value lines, quoting values so they stay intact when sourced."""
+    return "".join(f"{k}={shlex.quote(str(v))}\n" for k, v in data.items())
+
+
 def _fetch_provider_services_internal(bech32_pubkey: str) -> list[dict]:
     """Return provider services for a given pubkey (lightweight helper)."""
     cmd = ["arkeod", "--home", ARKEOD_HOME]
@@ -7657,9 +7684,10 @@ def _sign_message(
     preimage = sign_template.format(contract_id=contract_id, nonce=nonce)
             # signhere has no home/keyring flags; ensure ~/.arkeo -> ARKEOD_HOME exists, then call plainly.
     _ensure_signhere_home()
-    cmd = f'signhere -u "{client_key}" -m "{preimage}" | tail -n 1'
-    code, out = run(cmd)
-    out_clean = out.strip() if isinstance(out, str) else ""
+    code, out = run_list(["signhere", "-u", client_key, "-m", preimage])
+    # signhere prints the signature on its last output line
+    lines = out.strip().splitlines() if isinstance(out, str) else []
+    out_clean = lines[-1].strip() if lines else ""
     if code != 0 or not out_clean:
         return None, f"signhere_exit={code} output={out_clean}"
     sig_hex = _b64_or_hex_to_rs_hex(out_clean).lower()
@@ -10356,8 +10384,7 @@ def sentinel_rebuild():
     parsed["api"] = api_cfg or {"listen_addr": "0.0.0.0:3636"}
 
     try:
-        with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(parsed, f, sort_keys=False)
+        _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(parsed, Dumper=YamlSafeDumper, sort_keys=False))
     except OSError as e:
         return jsonify({"error": "failed to write sentinel config", "detail": str(e)}), 500
 
@@ -10381,29 +10408,8 @@ def sentinel_rebuild():
 @app.get("/api/sentinel-config")
 def sentinel_config():
     """Return sentinel-related env values and parsed sentinel.yaml if present."""
-    env_keys = [
-        "PROVIDER_NAME",
-        "MONIKER",
-        "WEBSITE",
-        "DESCRIPTION",
-        "LOCATION",
-        "PORT",
-        "SOURCE_CHAIN",
-        "PROVIDER_HUB_URI",
-        "EVENT_STREAM_HOST",
-        "FREE_RATE_LIMIT",
-        "FREE_RATE_LIMIT_DURATION",
-        "CLAIM_STORE_LOCATION",
-        "CONTRACT_CONFIG_STORE_LOCATION",
-        "PROVIDER_CONFIG_STORE_LOCATION",
-        "LOG_LEVEL",
-        "PROVIDER_PUBKEY",
-        "ARKEOD_NODE",
-        "EXTERNAL_ARKEOD_NODE",
-        "SENTINEL_NODE",
-        "SENTINEL_PORT",
-    ]
-    env_data = {k.lower(): os.getenv(k) for k in env_keys}
+    env = os.environ
+    env_data = {name: env.get(key) for name, key in _SENTINEL_ENV_FIELDS}
     env_file = _load_env_file(SENTINEL_ENV_PATH)
     parsed, raw = _load_sentinel_config()
     return jsonify(
@@ -10437,7 +10443,7 @@ def update_sentinel_config():
 
     try:
         with open(SENTINEL_CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=YamlSafeLoader) or {}
     except Exception as e:
         return jsonify({"error": "failed to read sentinel config", "detail": str(e)}), 500
 
@@ -10469,16 +10475,12 @@ def update_sentinel_config():
     # listen_addr and provider_pubkey are not user-editable in the UI anymore; we keep them unchanged unless provided explicitly
 
     try:
-        with open(SENTINEL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config, f, sort_keys=False)
+        _write_text_atomic(SENTINEL_CONFIG_PATH, yaml.dump(config, Dumper=YamlSafeDumper, sort_keys=False))
     except Exception as e:
         return jsonify({"error": "failed to write sentinel config", "detail": str(e)}), 500
 
     try:
-        with open(SENTINEL_ENV_PATH, "w", encoding="utf-8") as f:
-            for k, v in env_file.items():
-                # Quote values to keep spaces safe when sourced
-                f.write(f"{k}={shlex.quote(str(v))}\n")
+        _write_text_atomic(SENTINEL_ENV_PATH, _format_env_file(env_file))
     except Exception as e:
         return jsonify({"error": "failed to write sentinel env", "detail": str(e)}), 500
 